@@ -1,64 +1,76 @@
-"""Thread-safe parameter cache for GM3 gateway."""
+"""Parameter cache for GM3 gateway."""
 
-import asyncio
 from datetime import datetime
 
 from econext_gateway.core.models import Parameter
 
 
 class ParameterCache:
-    """Thread-safe in-memory cache for controller parameters.
+    """In-memory cache for controller parameters.
 
-    Provides async-safe access to cached parameters using asyncio.Lock().
     Parameters are stored by index (as string) for unique keying since
     multiple parameters can share the same name across address spaces.
+
+    All access happens on the gateway's single event loop and no method
+    awaits part-way through, so every call is atomic with respect to
+    other coroutines without a lock. The methods stay ``async`` so
+    callers are unaffected.
     """
 
     def __init__(self) -> None:
         """Initialize empty parameter cache."""
-        self._lock = asyncio.Lock()
         self._parameters: dict[str, Parameter] = {}  # keyed by str(index)
+        # name -> key of the first-inserted parameter with that name, so
+        # get_by_name (every API write) is a dict hit instead of a scan
+        self._name_index: dict[str, str] = {}
         self._last_update: datetime | None = None
 
     async def get(self, index: int) -> Parameter | None:
         """Get parameter by index."""
-        async with self._lock:
-            return self._parameters.get(str(index))
+        return self._parameters.get(str(index))
 
     async def get_by_name(self, name: str) -> Parameter | None:
         """Get parameter by name (returns first match)."""
-        async with self._lock:
-            for param in self._parameters.values():
-                if param.name == name:
-                    return param
-            return None
+        key = self._name_index.get(name)
+        return self._parameters[key] if key is not None else None
 
     async def get_all(self) -> dict[str, Parameter]:
         """Get all cached parameters keyed by index (as string)."""
-        async with self._lock:
-            return dict(self._parameters)
+        return dict(self._parameters)
 
     async def set(self, param: Parameter) -> None:
         """Store or update a parameter."""
-        async with self._lock:
-            self._parameters[str(param.index)] = param
-            self._last_update = datetime.now()
+        self._store(param)
+        self._last_update = datetime.now()
 
     async def set_many(self, params: list[Parameter]) -> None:
         """Store or update multiple parameters."""
         if not params:
             return
 
-        async with self._lock:
-            for param in params:
-                self._parameters[str(param.index)] = param
-            self._last_update = datetime.now()
+        for param in params:
+            self._store(param)
+        self._last_update = datetime.now()
 
     async def clear(self) -> None:
         """Remove all cached parameters."""
-        async with self._lock:
-            self._parameters.clear()
-            self._last_update = None
+        self._parameters.clear()
+        self._name_index.clear()
+        self._last_update = None
+
+    def _store(self, param: Parameter) -> None:
+        """Insert or replace *param* and keep the name index in step."""
+        key = str(param.index)
+        previous = self._parameters.get(key)
+        self._parameters[key] = param
+        if previous is not None and previous.name != param.name:
+            # A renamed index can change which entry is first for both
+            # names; rebuild in insertion order (rediscovery only).
+            self._name_index.clear()
+            for stored_key, stored in self._parameters.items():
+                self._name_index.setdefault(stored.name, stored_key)
+        else:
+            self._name_index.setdefault(param.name, key)
 
     @property
     def last_update(self) -> datetime | None:
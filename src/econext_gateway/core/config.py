@@ -23,6 +23,8 @@ class Settings(BaseSettings):
     request_timeout: float = 1.5
     destination_address: int = 1
     params_per_request: int = 100
+    alarm_batch_size: int = 1
+    struct_batch_size: int = 100
     token_required: bool = True
     state_dir: str = "/var/lib/econext-gateway"
 
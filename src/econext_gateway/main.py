@@ -1,5 +1,6 @@
 """Main application entry point."""
 
+import asyncio
 import logging
 import time as _time
 from contextlib import asynccontextmanager
@@ -37,6 +38,7 @@ async def lifespan(app: FastAPI):
 
     setup_logging(settings.log_level)
     logger.info(f"Starting ecoNEXT Gateway v{__version__}")
+    logger.info("Event loop: %s", type(asyncio.get_running_loop()).__module__)
 
     # Initialize components
     persist_file = Path(settings.state_dir) / "thermostat_temperature" if settings.thermostat_enabled else None
@@ -84,6 +86,8 @@ async def lifespan(app: FastAPI):
         poll_interval=settings.poll_interval,
         request_timeout=settings.request_timeout,
         params_per_request=settings.params_per_request,
+        alarm_batch_size=settings.alarm_batch_size,
+        struct_batch_size=settings.struct_batch_size,
         token_required=settings.token_required,
         paired_address_file=settings.paired_address_file,
         thermostat_emulator=thermostat_emulator,
@@ -5,6 +5,18 @@ from typing import Any
 
 from econext_gateway.protocol.constants import DataType
 
+# Precompiled little-endian layouts, one per fixed-size type code
+_INT8 = struct.Struct("<b")
+_INT16 = struct.Struct("<h")
+_INT32 = struct.Struct("<i")
+_INT64 = struct.Struct("<q")
+_UINT8 = struct.Struct("<B")
+_UINT16 = struct.Struct("<H")
+_UINT32 = struct.Struct("<I")
+_UINT64 = struct.Struct("<Q")
+_FLOAT = struct.Struct("<f")
+_DOUBLE = struct.Struct("<d")
+
 
 def encode_value(value: Any, type_code: int) -> bytes:
     """
@@ -29,38 +41,38 @@ def encode_value(value: Any, type_code: int) -> bytes:
         b'\\x01'
     """
     if type_code == DataType.INT8:
-        return struct.pack("<b", int(value))
+        return _INT8.pack(int(value))
 
     elif type_code == DataType.INT16:
-        return struct.pack("<h", int(value))
+        return _INT16.pack(int(value))
 
     elif type_code == DataType.INT32:
-        return struct.pack("<i", int(value))
+        return _INT32.pack(int(value))
 
     elif type_code == DataType.INT64:
-        return struct.pack("<q", int(value))
+        return _INT64.pack(int(value))
 
     elif type_code == DataType.UINT8:
-        return struct.pack("<B", int(value))
+        return _UINT8.pack(int(value))
 
     elif type_code == DataType.UINT16:
-        return struct.pack("<H", int(value))
+        return _UINT16.pack(int(value))
 
     elif type_code == DataType.UINT32:
-        return struct.pack("<I", int(value))
+        return _UINT32.pack(int(value))
 
     elif type_code == DataType.UINT64:
-        return struct.pack("<Q", int(value))
+        return _UINT64.pack(int(value))
 
     elif type_code == DataType.FLOAT:
-        return struct.pack("<f", float(value))
+        return _FLOAT.pack(float(value))
 
     elif type_code == DataType.DOUBLE:
-        return struct.pack("<d", float(value))
+        return _DOUBLE.pack(float(value))
 
     elif type_code == DataType.BOOL:
         bool_val = 1 if value else 0
-        return struct.pack("<B", bool_val)
+        return _UINT8.pack(bool_val)
 
     elif type_code == DataType.STRING:
         if isinstance(value, str):
@@ -100,59 +112,59 @@ def decode_value(data: bytes, type_code: int) -> int | float | bool | str:
     if type_code == DataType.INT8:
         if len(data) < 1:
             raise ValueError("Insufficient data for int8")
-        return struct.unpack("<b", data[0:1])[0]
+        return _INT8.unpack_from(data)[0]
 
     elif type_code == DataType.INT16:
         if len(data) < 2:
             raise ValueError("Insufficient data for int16")
-        return struct.unpack("<h", data[0:2])[0]
+        return _INT16.unpack_from(data)[0]
 
     elif type_code == DataType.INT32:
         if len(data) < 4:
             raise ValueError("Insufficient data for int32")
-        return struct.unpack("<i", data[0:4])[0]
+        return _INT32.unpack_from(data)[0]
 
     elif type_code == DataType.INT64:
         if len(data) < 8:
             raise ValueError("Insufficient data for int64")
-        return struct.unpack("<q", data[0:8])[0]
+        return _INT64.unpack_from(data)[0]
 
     elif type_code == DataType.UINT8:
         if len(data) < 1:
             raise ValueError("Insufficient data for uint8")
-        return struct.unpack("<B", data[0:1])[0]
+        return _UINT8.unpack_from(data)[0]
 
     elif type_code == DataType.UINT16:
         if len(data) < 2:
             raise ValueError("Insufficient data for uint16")
-        return struct.unpack("<H", data[0:2])[0]
+        return _UINT16.unpack_from(data)[0]
 
     elif type_code == DataType.UINT32:
         if len(data) < 4:
             raise ValueError("Insufficient data for uint32")
-        return struct.unpack("<I", data[0:4])[0]
+        return _UINT32.unpack_from(data)[0]
 
     elif type_code == DataType.UINT64:
         if len(data) < 8:
             raise ValueError("Insufficient data for uint64")
-        return struct.unpack("<Q", data[0:8])[0]
+        return _UINT64.unpack_from(data)[0]
 
     elif type_code == DataType.FLOAT:
         if len(data) < 4:
             raise ValueError("Insufficient data for float")
-        value = struct.unpack("<f", data[0:4])[0]
+        value = _FLOAT.unpack_from(data)[0]
         return round(value, 2)
 
     elif type_code == DataType.DOUBLE:
         if len(data) < 8:
             raise ValueError("Insufficient data for double")
-        value = struct.unpack("<d", data[0:8])[0]
+        value = _DOUBLE.unpack_from(data)[0]
         return round(value, 2)
 
     elif type_code == DataType.BOOL:
         if len(data) < 1:
             raise ValueError("Insufficient data for bool")
-        return struct.unpack("<B", data[0:1])[0] != 0
+        return _UINT8.unpack_from(data)[0] != 0
 
     elif type_code == DataType.STRING:
         # Find null terminator
@@ -164,6 +164,7 @@ TOKEN_TIMEOUT = 5.0  # Max time to wait for token grant (seconds, ~0.5 panel cyc
 
 # Alarm reading
 ALARM_REQUEST_PREFIX = b"\x00\x02\x00\x00\x01\x01\x00\x01\x01\x00"
+ALARM_RECORD_SIZE = 15  # code(1) + from_date(7) + to_date(7)
 
 # ============================================================================
 # Communication Settings
@@ -172,4 +173,11 @@ ALARM_REQUEST_PREFIX = b"\x00\x02\x00\x00\x01\x01\x00\x01\x01\x00"
 SERIAL_TIMEOUT = 0.2  # Serial read timeout (seconds)
 RETRY_ATTEMPTS = 3  # Number of retry attempts (matches original RESEND_ATTEMPTS=3)
 REQUEST_TIMEOUT = 3.0  # Request timeout (seconds, > 2s silence detection)
+RESPONSE_TIMEOUT = 2.0  # Wait for a matching response per request (seconds, 10 * 0.2s serial reads)
 POLL_INTERVAL = 10.0  # Parameter polling interval (seconds)
+POLL_BACKOFF_MAX = 120.0  # Cap on the poll delay after repeated errors (seconds)
+POLL_BACKOFF_JITTER = 0.15  # +/- fraction applied to backed-off poll delays
+DISCOVERY_RETRY_BASE = 0.05  # First delay before re-requesting an empty struct batch (seconds)
+DISCOVERY_RETRY_MAX = 1.0  # Cap on the struct re-request delay (seconds)
+DISCOVERY_RETRY_JITTER = 0.15  # Upper fraction added to struct re-request delays
+STRUCT_BATCH_SIZE = 100  # Structs requested per discovery frame (maxNumStructDPParams)
@@ -91,6 +91,10 @@ class FrameDispatcher:
                     await asyncio.sleep(0)
                     continue
                 await self._dispatch(frame)
+                # Greedy drain: frames that arrived in the same read burst
+                # are routed without another timed wait per frame.
+                while self._running and (frame := protocol.try_receive_frame_nowait()) is not None:
+                    await self._dispatch(frame)
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -6,6 +6,10 @@ from typing import Optional
 from econext_gateway.protocol.constants import BEGIN_FRAME, END_FRAME, FRAME_MIN_LEN
 from econext_gateway.protocol.crc import calculate_crc16
 
+# [BEGIN][LEN(LE16)][DA(LE16)][SA(LE16)][CMD] and [CRC(BE16)][END]
+_FRAME_HEADER = struct.Struct("<BHHHB")
+_FRAME_TRAILER = struct.Struct(">HB")
+
 
 class Frame:
     """
@@ -21,6 +25,10 @@ class Frame:
         data: Payload data
     """
 
+    # One instance per bus frame, hundreds per second on a busy bus. Slots
+    # keep it small while ``source`` stays assignable (unlike a NamedTuple).
+    __slots__ = ("destination", "source", "command", "data")
+
     def __init__(self, destination: int, command: int, data: bytes = b"", source: int = 0):
         """
         Initialize a frame.
@@ -52,48 +60,19 @@ class Frame:
             >>> frame_bytes[0] == 0x68  # BEGIN_FRAME
             True
         """
-        # Build frame without CRC and END
-        frame = bytearray()
-        frame.append(BEGIN_FRAME)
-
-        # Length (will be filled after we know data length)
-        frame.extend([0, 0])  # LEN_L, LEN_H
-
-        # Destination address (little-endian 16-bit)
-        frame.extend(struct.pack("<H", self.destination))
-
-        # Source address (little-endian 16-bit)
-        frame.extend(struct.pack("<H", self.source))
+        # Length field counts SA_H(1) + CMD(1) + DATA(n) + CRC(2) + END(1),
+        # i.e. the total frame size (11 + n) minus the 6 leading bytes.
+        length = len(self.data) + 5
 
-        # Command
-        frame.append(self.command)
+        # BEGIN, LEN, DA, SA, CMD in one pack; the payload joins it in a
+        # single concatenation instead of a chain of bytearray appends.
+        body = _FRAME_HEADER.pack(BEGIN_FRAME, length, self.destination, self.source, self.command) + self.data
 
-        # Data payload
-        if self.data:
-            frame.extend(self.data)
+        # CRC over bytes 1 to end (excluding BEGIN), walked in place
+        crc = calculate_crc16(memoryview(body)[1:])
 
-        # Calculate and update length (total length - 6 header bytes)
-        # Length = total frame size - 6 (BEGIN + LEN_L + LEN_H + DA_L + DA_H + SA_L)
-        # But actually length field represents bytes from SA_H onwards to END (inclusive)
-        # Current frame: BEGIN(1) + LEN(2) + DA(2) + SA(2) + CMD(1) + DATA(n) = 8 + n
-        # Will add: CRC(2) + END(1) = 3 bytes, so total = 11 + n
-        # Length value = total - 6 = 5 + n = SA_H(1) + CMD(1) + DATA(n) + CRC(2) + END(1)
-        length = len(frame) - 6 + 3  # -6 for BEGIN+LEN+DA+SA_L, +3 for CRC+END
-        frame[1] = length & 0xFF
-        frame[2] = (length >> 8) & 0xFF
-
-        # Calculate CRC over bytes 1 to end (excluding BEGIN, but before CRC and END)
-        crc_data = bytes(frame[1:])
-        crc = calculate_crc16(crc_data)
-
-        # Append CRC (big-endian)
-        frame.append((crc >> 8) & 0xFF)  # CRC_H
-        frame.append(crc & 0xFF)  # CRC_L
-
-        # Append END marker
-        frame.append(END_FRAME)
-
-        return bytes(frame)
+        # CRC (big-endian) + END marker
+        return body + _FRAME_TRAILER.pack(crc, END_FRAME)
 
     @classmethod
     def from_bytes(cls, data: bytes) -> Optional["Frame"]:
@@ -132,7 +111,7 @@ class Frame:
             return None
 
         # Extract and verify CRC
-        crc_data = data[1:-3]
+        crc_data = memoryview(data)[1:-3]  # CRC walks the bytes in place, no copy
         expected_crc = struct.unpack(">H", data[-3:-1])[0]
         calculated_crc = calculate_crc16(crc_data)
 
@@ -147,10 +126,7 @@ class Frame:
         payload = data[8:-3]
 
         # Create frame object
-        frame = cls(destination=destination, command=command, data=payload)
-        frame.source = source
-
-        return frame
+        return cls(destination=destination, command=command, data=payload, source=source)
 
     def __repr__(self) -> str:
         """String representation for debugging."""
@@ -8,13 +8,19 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 import struct
 import time as _time
+from collections import defaultdict, deque
 from collections.abc import Callable
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import takewhile
+from operator import attrgetter, is_not
 from pathlib import Path
+from sys import intern
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -24,22 +30,29 @@ from econext_gateway.core.cache import ParameterCache
 from econext_gateway.core.models import Alarm, Parameter
 from econext_gateway.protocol.codec import decode_value, encode_value
 from econext_gateway.protocol.constants import (
+    ALARM_RECORD_SIZE,
     ALARM_REQUEST_PREFIX,
     CLAIMABLE_ADDRESS_RANGE,
     CONTROLLER_ADDRESS,
     DEVICE_TABLE_FUNC,
+    DISCOVERY_RETRY_BASE,
+    DISCOVERY_RETRY_JITTER,
+    DISCOVERY_RETRY_MAX,
     GET_TOKEN_FUNC,
     GIVE_BACK_TOKEN_DATA,
     IDENTIFY_RESPONSE_DATA,
     PAIRING_ASSIGN_FUNC,
     PAIRING_BEACON_FUNC,
     PANEL_ADDRESS,
+    POLL_BACKOFF_JITTER,
+    POLL_BACKOFF_MAX,
     POLL_INTERVAL,
     REQUEST_TIMEOUT,
+    RESPONSE_TIMEOUT,
     RETRY_ATTEMPTS,
+    STRUCT_BATCH_SIZE,
     THERMOSTAT_CLAIMABLE_ADDRESS_RANGE,
     TOKEN_TIMEOUT,
-    TYPE_SIZES,
     Command,
     DataType,
 )
@@ -97,7 +110,7 @@ def _log_thermostat_frame(
     extra = ""
     if frame.command == 0xC0 and frame.data and len(frame.data) >= 8:
         try:
-            temp = struct.unpack("<f", frame.data[4:8])[0]
+            temp = _F32.unpack_from(frame.data, 4)[0]
             extra = f" temp={temp:.1f}"
         except struct.error:
             pass
@@ -125,6 +138,19 @@ def _log_thermostat_frame(
 class ParamStructEntry:
     """Metadata for a single parameter from struct response."""
 
+    # Hundreds of these live in `_param_structs` per controller.
+    __slots__ = (
+        "index",
+        "name",
+        "unit",
+        "type_code",
+        "writable",
+        "min_value",
+        "max_value",
+        "min_param_ref",
+        "max_param_ref",
+    )
+
     def __init__(
         self,
         index: int,
@@ -162,8 +188,73 @@ UNIT_STRING_MAP = {
     "kWh": 8,
 }
 
+# Precompiled layouts; unpack_from reads straight out of the payload without
+# slicing a temporary bytes object. _U16 covers every LE index/function code
+# read on the receive path (headers, validators, SERVICE func codes).
+_U16 = struct.Struct("<H")
+_F32 = struct.Struct("<f")
+_RANGE_U16 = struct.Struct("<HH")
+_RANGE_I16 = struct.Struct("<hh")
+# address (LE16) + temperature (LE float): one SERVICE 0x2001 device-table row
+_DEVICE_ENTRY = struct.Struct("<Hf")
+# count(1) + start index (LE16): GET_PARAMS / GET_PARAMS_STRUCT request body
+_PARAMS_REQUEST = struct.Struct("<BH")
+# year(LE int16), month, day, hour, minute, second
+_ALARM_DATE = struct.Struct("<h5B")
+_NULL_ALARM_DATE = b"\xff" * _ALARM_DATE.size
+_UNSIGNED_RANGE_TYPES = frozenset((DataType.UINT8, DataType.UINT16, DataType.UINT32))
+
+# Fixed-size value layouts for GET_PARAMS_RESPONSE, compiled once at import.
+# STRING is variable-length and decoded separately.
+_STRUCT_BY_TYPE: dict[int, struct.Struct] = {
+    DataType.INT8: struct.Struct("<b"),
+    DataType.INT16: struct.Struct("<h"),
+    DataType.INT32: struct.Struct("<i"),
+    DataType.INT64: struct.Struct("<q"),
+    DataType.UINT8: struct.Struct("<B"),
+    DataType.UINT16: struct.Struct("<H"),
+    DataType.UINT32: struct.Struct("<I"),
+    DataType.UINT64: struct.Struct("<Q"),
+    DataType.FLOAT: struct.Struct("<f"),
+    DataType.DOUBLE: struct.Struct("<d"),
+    DataType.BOOL: struct.Struct("<B"),
+}
+_FLOAT_TYPES = frozenset((DataType.FLOAT, DataType.DOUBLE))
+_get_type_code = attrgetter("type_code")
+_get_index = attrgetter("index")
+_is_entry = partial(is_not, None)
+# Alarm dates are decoded to datetime once per record, so sorting compares the
+# already-built objects through a C-level key getter.
+_alarm_from_date = attrgetter("from_date")
+
+
+@lru_cache(maxsize=256)
+def _batch_layout(type_codes: tuple[int, ...]) -> tuple[struct.Struct, tuple[int, ...], tuple[int, ...]] | None:
+    """Compile one Struct covering a run of fixed-size GET_PARAMS values.
+
+    Each value is preceded by its 1-byte separator (``x`` pad), so the
+    layout unpacks from offset 3. Covers the longest fixed-size prefix of
+    ``type_codes``: a STRING (or unknown type) ends the run and the caller
+    walks the rest per entry. Returns the Struct plus the positions
+    needing BOOL and FLOAT/DOUBLE post-conversion, or None when the very
+    first type has no fixed layout. Keyed on the type sequence itself, so
+    rediscovery can never leave a stale layout behind.
+    """
+    chars = []
+    for type_code in type_codes:
+        layout = _STRUCT_BY_TYPE.get(type_code)
+        if layout is None:
+            break
+        chars.append("x" + layout.format[1:])
+    if not chars:
+        return None
+    type_codes = type_codes[: len(chars)]
+    bool_positions = tuple(i for i, t in enumerate(type_codes) if t == DataType.BOOL)
+    float_positions = tuple(i for i, t in enumerate(type_codes) if t in _FLOAT_TYPES)
+    return struct.Struct("<" + "".join(chars)), bool_positions, float_positions
+
 
-@dataclass
+@dataclass(slots=True)
 class DeviceTableEntry:
     """A device in the panel's bus device table (from SERVICE 0x2001)."""
 
@@ -171,7 +262,7 @@ class DeviceTableEntry:
     temperature: float
 
 
-@dataclass
+@dataclass(slots=True)
 class BusDevice:
     """A device known to exist on the RS-485 bus."""
 
@@ -182,7 +273,7 @@ class BusDevice:
     last_seen: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class _PendingRequest:
     """An outbound request awaiting a matching response frame.
 
@@ -196,6 +287,7 @@ class _PendingRequest:
     accept_cmds: set[int]
     validator: Callable[[Frame], bool] | None
     future: asyncio.Future
+    min_len: int = 0  # shorter expected_cmd payloads are rejected before the validator
 
 
 _KNOWN_ADDRESSES: dict[int, str] = {
@@ -227,8 +319,7 @@ def parse_device_table(data: bytes) -> list[DeviceTableEntry]:
     entries = []
     offset = 4  # skip func code + padding
     while offset + 6 <= len(data):
-        addr = struct.unpack("<H", data[offset : offset + 2])[0]
-        temp = struct.unpack("<f", data[offset + 2 : offset + 6])[0]
+        addr, temp = _DEVICE_ENTRY.unpack_from(data, offset)
         entries.append(DeviceTableEntry(address=addr, temperature=round(temp, 2)))
         offset += 6
 
@@ -247,12 +338,10 @@ def parse_get_params_request(data: bytes) -> tuple[int, int]:
     Raises:
         ValueError: If data is too short.
     """
-    if len(data) < 3:
-        raise ValueError(f"GET_PARAMS request too short: {len(data)} bytes")
-
-    count = data[0]
-    start_index = struct.unpack("<H", data[1:3])[0]
-    return count, start_index
+    try:
+        return _PARAMS_REQUEST.unpack_from(data)
+    except struct.error:
+        raise ValueError(f"GET_PARAMS request too short: {len(data)} bytes") from None
 
 
 def parse_get_params_response(
@@ -284,18 +373,47 @@ def parse_get_params_response(
         raise ValueError(f"GET_PARAMS_RESPONSE too short: {len(data)} bytes")
 
     params_no = data[0]
-    first_index = struct.unpack("<H", data[1:3])[0]
+    first_index = _U16.unpack_from(data, 1)[0]
 
-    results = []
+    results: list[tuple[int, Any]] = []
     offset = 4  # Skip header (3 bytes) + first separator byte
 
-    for i in range(params_no):
-        param_index = first_index + i + store_offset
-
-        if param_index not in param_structs:
+    # Runs for every poll batch: bind lookups to locals once per response
+    data_len = len(data)
+    get_entry = param_structs.get
+    get_struct = _STRUCT_BY_TYPE.get
+    append = results.append
+    base_index = first_index + store_offset
+
+    # Fast path: a run of known fixed-size values decodes in a single
+    # unpack_from. Stops at the first unknown index like the loop below.
+    # The run and its type column are gathered with map/takewhile so the
+    # per-entry lookups stay in C rather than in a bytecode loop.
+    walk_from = base_index
+    known = tuple(takewhile(_is_entry, map(get_entry, range(base_index, base_index + params_no))))
+    if known:
+        batch = _batch_layout(tuple(map(_get_type_code, known)))
+        if batch is not None and 3 + batch[0].size <= data_len:
+            layout, bool_positions, float_positions = batch
+            values = list(layout.unpack_from(data, 3))
+            for i in bool_positions:
+                values[i] = values[i] != 0
+            for i in float_positions:
+                values[i] = round(values[i], 2)
+            walk_from = base_index + len(values)
+            results = list(zip(range(base_index, walk_from), values, strict=True))
+            if len(values) == len(known):
+                return results
+            # A STRING ended the fixed-size run: walk the rest from there
+            append = results.append
+            offset = 4 + layout.size
+
+    # Per-entry walk: strings, or a response truncated mid-batch
+    for param_index in range(walk_from, base_index + params_no):
+        entry = get_entry(param_index)
+        if entry is None:
             break
 
-        entry = param_structs[param_index]
         type_code = entry.type_code
 
         if type_code == DataType.STRING:
@@ -303,23 +421,27 @@ def parse_get_params_response(
             null_pos = data.find(b"\x00", offset)
             if null_pos == -1:
                 break
-            value_bytes = data[offset : null_pos + 1]
-            value_len = len(value_bytes)
+            value_len = null_pos + 1 - offset
+            try:
+                value = decode_value(data[offset : null_pos + 1], type_code)
+            except ValueError as e:
+                logger.warning(f"Failed to decode param {param_index}: {e}")
+                break
         else:
-            value_len = TYPE_SIZES.get(type_code, 0)
-            if value_len == 0:
+            layout = get_struct(type_code)
+            if layout is None:
                 break
-            if offset + value_len > len(data):
+            value_len = layout.size
+            if offset + value_len > data_len:
                 break
-            value_bytes = data[offset : offset + value_len]
-
-        try:
-            decoded = decode_value(value_bytes, type_code)
-            results.append((param_index, decoded))
-        except (ValueError, struct.error) as e:
-            logger.warning(f"Failed to decode param {param_index}: {e}")
-            break
-
+            # Same conversions as codec.decode_value
+            value = layout.unpack_from(data, offset)[0]
+            if type_code == DataType.BOOL:
+                value = value != 0
+            elif type_code in _FLOAT_TYPES:
+                value = round(value, 2)
+
+        append((param_index, value))
         offset += value_len + 1  # +1 to skip separator byte after value
 
     return results
@@ -348,7 +470,7 @@ def parse_struct_response(data: bytes) -> list[ParamStructEntry]:
         raise ValueError(f"Struct response too short: {len(data)} bytes")
 
     params_no = data[0]
-    first_index = struct.unpack("<H", data[1:3])[0]
+    first_index = _U16.unpack_from(data, 1)[0]
 
     entries = []
     offset = 3
@@ -390,34 +512,35 @@ def parse_struct_response(data: bytes) -> list[ParamStructEntry]:
         if offset + 4 > len(data):
             break
 
+        # Both halves decoded once; refs are always unsigned indices
+        ref_min, ref_max = _RANGE_U16.unpack_from(data, offset)
+        if type_code in _UNSIGNED_RANGE_TYPES:
+            lit_min, lit_max = ref_min, ref_max
+        else:
+            lit_min, lit_max = _RANGE_I16.unpack_from(data, offset)
+
         # Min value
         if extra_byte & 0x10:
             # Dynamic min: value is a parameter index reference, not a literal
-            min_param_ref = struct.unpack("<H", data[offset : offset + 2])[0]
+            min_param_ref = ref_min
         elif not (extra_byte & 0x40):
-            # Literal min value
-            if type_code in (DataType.UINT8, DataType.UINT16, DataType.UINT32):
-                min_value = float(struct.unpack("<H", data[offset : offset + 2])[0])
-            else:
-                min_value = float(struct.unpack("<h", data[offset : offset + 2])[0])
+            min_value = float(lit_min)
 
         # Max value
         if extra_byte & 0x20:
             # Dynamic max: value is a parameter index reference, not a literal
-            max_param_ref = struct.unpack("<H", data[offset + 2 : offset + 4])[0]
+            max_param_ref = ref_max
         elif not (extra_byte & 0x80):
-            if type_code in (DataType.UINT8, DataType.UINT16, DataType.UINT32):
-                max_value = float(struct.unpack("<H", data[offset + 2 : offset + 4])[0])
-            else:
-                max_value = float(struct.unpack("<h", data[offset + 2 : offset + 4])[0])
+            max_value = float(lit_max)
 
         offset += 4
 
         # Map unit string to code
         unit_code = UNIT_STRING_MAP.get(unit_str, 0)
 
-        # Sanitize name: replace spaces
-        name = name.replace(" ", "_").strip()
+        # Sanitize name: replace spaces. Interned so regulator/panel
+        # duplicates and every rediscovery share one str (hash cached).
+        name = intern(name.replace(" ", "_").strip())
 
         param_index = first_index + i
         entries.append(
@@ -454,7 +577,7 @@ def parse_struct_response_no_range(data: bytes) -> list[ParamStructEntry]:
         raise ValueError(f"Struct response too short: {len(data)} bytes")
 
     params_no = data[0]
-    first_index = struct.unpack("<H", data[1:3])[0]
+    first_index = _U16.unpack_from(data, 1)[0]
 
     entries = []
     offset = 3
@@ -480,7 +603,8 @@ def parse_struct_response_no_range(data: bytes) -> list[ParamStructEntry]:
         # Read exponent and type bytes (WITHOUT_RANGE format)
         if offset + 2 > len(data):
             break
-        _exp, type_byte = struct.unpack("<bB", data[offset : offset + 2])
+        # data[offset] is the exponent byte, unused here
+        type_byte = data[offset + 1]
         offset += 2
 
         type_code = type_byte & 0x0F
@@ -491,8 +615,9 @@ def parse_struct_response_no_range(data: bytes) -> list[ParamStructEntry]:
         # Map unit string to code
         unit_code = UNIT_STRING_MAP.get(unit_str, 0)
 
-        # Sanitize name: replace spaces
-        name = name.replace(" ", "_").strip()
+        # Sanitize name: replace spaces. Interned so regulator/panel
+        # duplicates and every rediscovery share one str (hash cached).
+        name = intern(name.replace(" ", "_").strip())
 
         param_index = first_index + i
         entries.append(
@@ -518,7 +643,7 @@ def build_get_params_request(start_index: int, count: int) -> bytes:
     Returns:
         Request payload bytes.
     """
-    return struct.pack("<BH", count, start_index)
+    return _PARAMS_REQUEST.pack(count, start_index)
 
 
 def build_struct_request(start_index: int, count: int) -> bytes:
@@ -531,7 +656,18 @@ def build_struct_request(start_index: int, count: int) -> bytes:
     Returns:
         Request payload bytes.
     """
-    return struct.pack("<BH", count, start_index)
+    return _PARAMS_REQUEST.pack(count, start_index)
+
+
+# Authorization header (matches original: USER-000\x004096\x00)
+_AUTH_HEADER = b"USER-000\x004096\x00"
+# Auth header + mode byte + parameter index (LE 16-bit), packed in one call
+_MODIFY_PARAM_HEADER = struct.Struct("<14sBH")
+# Header + value for each fixed-size type: a whole request in one pack call
+_MODIFY_PARAM_PACKERS: dict[int, Callable[..., bytes]] = {
+    type_code: struct.Struct(_MODIFY_PARAM_HEADER.format + layout.format[1:]).pack
+    for type_code, layout in _STRUCT_BY_TYPE.items()
+}
 
 
 def build_modify_param_request(index: int, value: Any, type_code: int) -> bytes:
@@ -550,10 +686,37 @@ def build_modify_param_request(index: int, value: Any, type_code: int) -> bytes:
     Returns:
         Request payload bytes.
     """
-    # Authorization header (matches original: USER-000\x004096\x00)
-    auth = b"\x55\x53\x45\x52\x2d\x30\x30\x30\x00\x34\x30\x39\x36\x00"
-    # Mode byte 0x01 + parameter index (LE 16-bit) + encoded value
-    return auth + b"\x01" + struct.pack("<H", index) + encode_value(value, type_code)
+    pack = _MODIFY_PARAM_PACKERS.get(type_code)
+    if pack is None:
+        # STRING (variable length) and unknown types go through the codec
+        return _MODIFY_PARAM_HEADER.pack(_AUTH_HEADER, 0x01, index) + encode_value(value, type_code)
+    # Same coercions as codec.encode_value
+    if type_code in _FLOAT_TYPES:
+        value = float(value)
+    elif type_code == DataType.BOOL:
+        value = 1 if value else 0
+    else:
+        value = int(value)
+    return pack(_AUTH_HEADER, 0x01, index, value)
+
+
+@lru_cache(maxsize=512)
+def _decode_alarm_date_cached(data: bytes) -> datetime | None:
+    """Decode exactly 7 alarm-date bytes; see `ProtocolHandler._decode_alarm_date`.
+
+    Memoised because the alarm history is re-read every few poll cycles
+    and rarely changes, so the same raw dates come back each time. The
+    result is an immutable datetime (or None), safe to share.
+    """
+    if data == _NULL_ALARM_DATE:
+        return None
+    try:
+        year, month, day, hour, minute, second = _ALARM_DATE.unpack_from(data)
+        if year < 1 or month < 1 or month > 12 or day < 1 or day > 31:
+            return None
+        return datetime(year=year, month=month, day=day, hour=hour, minute=minute, second=second)
+    except (ValueError, OverflowError):
+        return None
 
 
 class ProtocolHandler:
@@ -570,12 +733,16 @@ class ProtocolHandler:
         destination: int = CONTROLLER_ADDRESS,
         poll_interval: float = POLL_INTERVAL,
         request_timeout: float = REQUEST_TIMEOUT,
+        response_timeout: float = RESPONSE_TIMEOUT,
         params_per_request: int = 50,
         token_timeout: float = TOKEN_TIMEOUT,
         token_required: bool = True,
         paired_address_file: Path | None = None,
         thermostat_emulator: ThermostatEmulator | None = None,
         thermostat_address_file: Path | None = None,
+        alarm_batch_size: int = 1,
+        struct_batch_size: int = STRUCT_BATCH_SIZE,
+        discovery_retry_base: float = DISCOVERY_RETRY_BASE,
     ):
         """Initialize protocol handler.
 
@@ -585,6 +752,8 @@ class ProtocolHandler:
             destination: Controller address to communicate with.
             poll_interval: Seconds between poll cycles.
             request_timeout: Timeout for individual requests.
+            response_timeout: How long send_and_receive waits for a
+                matching response before giving up.
             params_per_request: Number of params per GET_PARAMS request.
             token_timeout: Seconds to wait for token before fallback.
             token_required: If True, wait indefinitely for token (like original).
@@ -599,12 +768,26 @@ class ProtocolHandler:
             thermostat_address_file: Path to persist thermostat bus address.
                 When the thermostat has address=0 it will auto-register
                 via IDENTIFY during pairing and persist the address here.
+            alarm_batch_size: Alarms to request per SERVICE frame. 1 (default)
+                sends the plain one-index request. Larger values append a
+                count byte and walk the reply in ALARM_RECORD_SIZE strides;
+                if the controller does not answer a batched request, that
+                index is retried alone and, once the single-index read
+                succeeds, the handler keeps reading one alarm per request.
+            struct_batch_size: Structs requested per discovery frame (1-255).
+                The walk always resumes after the last index actually
+                returned, so a controller that answers a large window
+                with fewer entries costs nothing extra; a firmware that
+                fills the whole window needs far fewer round-trips.
+            discovery_retry_base: First delay before re-requesting an empty
+                struct batch; doubles per retry up to DISCOVERY_RETRY_MAX.
         """
         self._connection = connection
         self._cache = cache
         self._destination = destination
         self._poll_interval = poll_interval
         self._request_timeout = request_timeout
+        self._response_timeout = response_timeout
         self._params_per_request = params_per_request
         self._token_timeout = token_timeout
         self._token_required = token_required
@@ -624,8 +807,14 @@ class ProtocolHandler:
         self._tentative_since: float | None = None
 
         self._param_structs: dict[int, ParamStructEntry] = {}
+        # Encoded GET_PARAMS bodies keyed by (start_index, count). The poll
+        # batches are fixed once discovery has run, so each cycle reuses them.
+        self._poll_request_cache: dict[tuple[int, int], bytes] = {}
+        self._discovery_retry_base = discovery_retry_base
         self._total_params: int = 0
-        self._alarms: list[Alarm] = []
+        self._alarms: tuple[Alarm, ...] = ()
+        self._alarm_batch_size = max(1, min(alarm_batch_size, 255))
+        self._struct_batch_size = max(1, min(struct_batch_size, 255))
         self._device_table: list[DeviceTableEntry] = []
         self._device_registry: dict[int, BusDevice] = {}
         if self._registration_state == "paired":
@@ -638,7 +827,8 @@ class ProtocolHandler:
         self._running = False
         self._lock = asyncio.Lock()
         self._lock_holder: str | None = None
-        self._has_token = False
+        # Held for a single request/response exchange in send_and_receive.
+        self._bus_lock = asyncio.Lock()
         self._thermostat = thermostat_emulator
         self._thermostat_address_file = thermostat_address_file
 
@@ -651,16 +841,25 @@ class ProtocolHandler:
         self._dispatcher: FrameDispatcher | None = None
         self._watchdog_task: asyncio.Task | None = None
         # Set when the panel grants us the bus token (SERVICE/GET_TOKEN).
-        # Cleared when we return the token. `_wait_for_token` waits on this.
+        # Cleared when we return the token. `_wait_for_token` waits on this
+        # and `_has_token` reads it, so there is no separate flag to keep
+        # in sync.
         self._token_event = asyncio.Event()
         # Outbound request awaiting a matching response frame. The dispatcher
         # resolves the future when a matching frame arrives.
         self._pending_request: _PendingRequest | None = None
-        # Small buffer for response-shaped frames that arrived slightly
-        # before `send_and_receive` set the pending slot. Size-capped so
-        # it can't grow unbounded in production.
-        self._unmatched_response_buffer: list[Frame] = []
+        # Small ring buffers for response-shaped frames that arrived slightly
+        # before `send_and_receive` set the pending slot, keyed by command so
+        # a request only scans frames it could accept. Each is size-capped
+        # so it can't grow unbounded in production.
         self._unmatched_buffer_max = 8
+        self._unmatched_responses: defaultdict[int, deque[Frame]] = defaultdict(
+            lambda: deque(maxlen=self._unmatched_buffer_max)
+        )
+        # MODIFY_PARAM payloads queued by write_param, each with the future
+        # that receives its ack. Whoever holds `_lock` next sends them all
+        # under one token grant (see `_flush_pending_writes`).
+        self._pending_writes: list[tuple[bytes, asyncio.Future[bool]]] = []
         # Track the last-logged device-table address set so we only emit
         # the "Bus devices" summary on membership changes (panel broadcasts
         # the table every ~10 s, but membership itself rarely changes).
@@ -879,11 +1078,24 @@ class ProtocolHandler:
             return _KNOWN_THERMOSTAT_ADDRS | {self._thermostat.address}
         return _KNOWN_THERMOSTAT_ADDRS
 
+    @staticmethod
+    def _literal_bounds(entry: ParamStructEntry) -> tuple[float | None, float | None] | None:
+        """Return the entry's min/max when neither is a parameter reference.
+
+        Returns None when a bound must be resolved via `_resolve_min_max`.
+        Most entries have literal bounds, so the hot decode paths skip
+        awaiting the resolver for them.
+        """
+        if entry.min_param_ref is None and entry.max_param_ref is None:
+            return entry.min_value, entry.max_value
+        return None
+
     async def _resolve_min_max(self, entry: ParamStructEntry) -> tuple[float | None, float | None]:
         """Resolve min/max values, following parameter index references.
 
         When a parameter's min/max is a reference to another parameter's index,
         look up that parameter's current value in the cache to get the actual limit.
+        Entries without references are handled by `_literal_bounds`.
         """
         min_val = entry.min_value
         max_val = entry.max_value
@@ -904,6 +1116,11 @@ class ProtocolHandler:
 
         return min_val, max_val
 
+    @property
+    def _has_token(self) -> bool:
+        """Whether we currently hold the bus token (mirrors `_token_event`)."""
+        return self._token_event.is_set()
+
     @property
     def connected(self) -> bool:
         """Whether the serial connection is active."""
@@ -915,9 +1132,9 @@ class ProtocolHandler:
         return len(self._param_structs)
 
     @property
-    def alarms(self) -> list[Alarm]:
-        """Get cached alarm history."""
-        return list(self._alarms)
+    def alarms(self) -> tuple[Alarm, ...]:
+        """Get cached alarm history (immutable snapshot, replaced on each read)."""
+        return self._alarms
 
     @property
     def running(self) -> bool:
@@ -1009,10 +1226,9 @@ class ProtocolHandler:
         elif frame.command == Command.SERVICE:
             func_code = 0
             if len(frame.data) >= 2:
-                func_code = struct.unpack("<H", frame.data[0:2])[0]
+                func_code = _U16.unpack_from(frame.data, 0)[0]
 
             if func_code == GET_TOKEN_FUNC:
-                self._has_token = True
                 self._token_event.set()
                 logger.debug("Token received from master panel")
             elif func_code == DEVICE_TABLE_FUNC:
@@ -1036,7 +1252,6 @@ class ProtocolHandler:
             source=self._source_address,
         )
         await self._connection.protocol.write_frame(token_frame)
-        self._has_token = False
         self._token_event.clear()
         logger.debug("Token returned to master panel")
 
@@ -1049,50 +1264,44 @@ class ProtocolHandler:
         the wait does not also cover a multi-second panel cycle.
 
         When `token_required=True`, waits indefinitely (matches original
-        webserver behaviour). When False, falls back after
-        `token_timeout` seconds.
+        webserver behaviour), waking every 5 s only to log progress. When
+        False, a single bounded wait falls back after `token_timeout`
+        seconds.
         """
         if not self._token_required and self._token_timeout <= 0:
             return
-        if self._has_token:
+        if self._token_event.is_set():
             return
 
-        if self._token_required:
-            logger.debug("Waiting for token from panel (indefinite)...")
-        else:
+        token_wait_start = _time.monotonic()
+
+        if not self._token_required:
             logger.debug(
                 "Waiting for token from panel (%.0fs timeout)...", self._token_timeout
             )
+            try:
+                await asyncio.wait_for(self._token_event.wait(), timeout=self._token_timeout)
+            except TimeoutError:
+                logger.info(
+                    "TOKEN timeout waited=%.1fs proceeding without token",
+                    _time.monotonic() - token_wait_start,
+                )
+                return
+            logger.debug(
+                "TOKEN granted waited=%.1fs", _time.monotonic() - token_wait_start
+            )
+            return
 
-        token_wait_start = _time.monotonic()
-        last_noprog_log = token_wait_start
-
-        while not self._has_token:
-            now_mono = _time.monotonic()
-            if self._token_required:
-                wait_slice = 5.0
-            else:
-                remaining = self._token_timeout - (now_mono - token_wait_start)
-                if remaining <= 0:
-                    logger.info(
-                        "TOKEN timeout waited=%.1fs proceeding without token",
-                        now_mono - token_wait_start,
-                    )
-                    return
-                wait_slice = min(remaining, 5.0)
-
+        logger.debug("Waiting for token from panel (indefinite)...")
+        while not self._token_event.is_set():
             try:
-                await asyncio.wait_for(self._token_event.wait(), timeout=wait_slice)
-                break
+                await asyncio.wait_for(self._token_event.wait(), timeout=5.0)
             except TimeoutError:
-                now_mono = _time.monotonic()
-                if now_mono - last_noprog_log >= 5.0:
-                    logger.info(
-                        "TOKEN waited=%.1fs no_grant_yet lock_holder=%s",
-                        now_mono - token_wait_start,
-                        self._lock_holder,
-                    )
-                    last_noprog_log = now_mono
+                logger.info(
+                    "TOKEN waited=%.1fs no_grant_yet lock_holder=%s",
+                    _time.monotonic() - token_wait_start,
+                    self._lock_holder,
+                )
 
         logger.debug(
             "TOKEN granted waited=%.1fs", _time.monotonic() - token_wait_start
@@ -1127,12 +1336,27 @@ class ProtocolHandler:
         if frame.command != pending.expected_cmd:
             return False
 
+        if len(frame.data) < pending.min_len:
+            return False
+
         if pending.validator is not None and not pending.validator(frame):
             return False
 
         pending.future.set_result(frame)
         return True
 
+    def _match_buffered_response(self, expected_response: int | None, accept_cmds: set[int]) -> bool:
+        """Resolve the pending request from a buffered frame, if one matches."""
+        for command in (expected_response, *accept_cmds):
+            buffered = self._unmatched_responses.get(command)
+            if not buffered:
+                continue
+            for buf_frame in buffered:
+                if self._try_match_pending(buf_frame):
+                    buffered.remove(buf_frame)
+                    return True
+        return False
+
     async def _route_inbound(self, frame: Frame) -> bool:
         """Dispatcher subscriber: route a single inbound frame.
 
@@ -1176,7 +1400,7 @@ class ProtocolHandler:
             dev.last_seen = loop.time()
 
         if frame.command == Command.SERVICE and len(frame.data) >= 2:
-            func_code = struct.unpack("<H", frame.data[0:2])[0]
+            func_code = _U16.unpack_from(frame.data, 0)[0]
             target_note = (
                 " (TO US)" if frame.destination == self._source_address else ""
             )
@@ -1193,7 +1417,7 @@ class ProtocolHandler:
             and frame.command == Command.SERVICE
             and len(frame.data) >= 2
         ):
-            func_code = struct.unpack("<H", frame.data[0:2])[0]
+            func_code = _U16.unpack_from(frame.data, 0)[0]
             if func_code == DEVICE_TABLE_FUNC:
                 self._process_device_table(frame.data, loop.time())
                 self._device_table_seen = True
@@ -1221,7 +1445,7 @@ class ProtocolHandler:
             and frame.source == PANEL_ADDRESS
             and frame.command == Command.SERVICE
             and len(frame.data) >= 2
-            and struct.unpack("<H", frame.data[0:2])[0] == PAIRING_BEACON_FUNC
+            and _U16.unpack_from(frame.data, 0)[0] == PAIRING_BEACON_FUNC
         ):
             self._thermostat_reg_state = "beacon_responded"
             self._thermostat_tentative_since = loop.time()
@@ -1236,9 +1460,9 @@ class ProtocolHandler:
             and frame.source == PANEL_ADDRESS
             and frame.command == Command.SERVICE
             and len(frame.data) >= 6
-            and struct.unpack("<H", frame.data[0:2])[0] == PAIRING_ASSIGN_FUNC
+            and _U16.unpack_from(frame.data, 0)[0] == PAIRING_ASSIGN_FUNC
         ):
-            assigned_addr = struct.unpack("<H", frame.data[4:6])[0]
+            assigned_addr = _U16.unpack_from(frame.data, 4)[0]
             logger.info(
                 "Thermostat: panel assigned address %d (from SERVICE 0x2005)",
                 assigned_addr,
@@ -1420,9 +1644,7 @@ class ProtocolHandler:
         # buffer it so a `send_and_receive` starting shortly can still
         # pick it up — covers the race where a response arrives between
         # two back-to-back requests.
-        self._unmatched_response_buffer.append(frame)
-        if len(self._unmatched_response_buffer) > self._unmatched_buffer_max:
-            self._unmatched_response_buffer.pop(0)
+        self._unmatched_responses[frame.command].append(frame)
         return False
 
     async def _bus_silence_watchdog(self) -> None:
@@ -1457,13 +1679,15 @@ class ProtocolHandler:
         also_accept_commands: list[int] | None = None,
         response_validator: Callable[[Frame], bool] | None = None,
         destination: int | None = None,
+        response_min_len: int = 0,
     ) -> Frame | None:
         """Send a frame and wait for a matching response.
 
         Post-refactor: registers a `_PendingRequest` that the frame
         dispatcher resolves when a matching response arrives. The old
         inline polling loop is gone; only one request is in flight at
-        a time, serialised via `_lock` as before.
+        a time, serialised via `_bus_lock` for the whole write/response
+        exchange (callers additionally hold `_lock` for token ownership).
 
         Args:
             command: Command code to send.
@@ -1474,6 +1698,9 @@ class ProtocolHandler:
                 the response_validator.
             response_validator: Optional callable to validate response data.
             destination: Override destination address (default: self._destination).
+            response_min_len: Minimum payload length for an expected_response
+                frame; shorter frames are dropped without calling the
+                response_validator, which may then index the header freely.
 
         Returns:
             Response frame, or None on timeout.
@@ -1483,60 +1710,75 @@ class ProtocolHandler:
             destination=dest, command=command, data=data, source=self._source_address
         )
 
-        accept_set = set(also_accept_commands) if also_accept_commands else set()
+        if expected_response is None:
+            return await self._send_only(request)
 
+        accept_set = set(also_accept_commands) if also_accept_commands else set()
         pending = _PendingRequest(
             destination=dest,
             expected_cmd=expected_response,
             accept_cmds=accept_set,
             validator=response_validator,
             future=asyncio.get_running_loop().create_future(),
+            min_len=response_min_len,
         )
-        # Cancel any prior unresolved pending (shouldn't happen — lock serialises).
-        if (
-            self._pending_request is not None
-            and not self._pending_request.future.done()
-        ):
-            self._pending_request.future.cancel()
-        self._pending_request = pending
-
-        # Check if a buffered response-shape frame already matches this
-        # pending request. Matched frames are removed; unmatched ones stay
-        # for a future request (still size-capped).
-        remaining: list[Frame] = []
-        matched_one = False
-        for buf_frame in self._unmatched_response_buffer:
-            if not matched_one and self._try_match_pending(buf_frame):
-                matched_one = True
-            else:
-                remaining.append(buf_frame)
-        self._unmatched_response_buffer = remaining
+        return await self._send_and_wait(request, pending)
 
-        try:
+    async def _send_only(self, request: Frame) -> None:
+        """Fire-and-forget half of `send_and_receive`.
+
+        Nothing is registered for matching, so frames that arrive while we
+        transmit are routed normally instead of being claimed by a request
+        that will never read them.
+        """
+        async with self._bus_lock:
             # 20ms RS-485 bus turnaround delay
             await asyncio.sleep(0.02)
 
-            success = await self._connection.protocol.write_frame(
-                request, flush_after=True
-            )
-            if not success:
-                logger.warning(f"Failed to send command 0x{command:02X}")
-                return None
+            if not await self._connection.protocol.write_frame(request, flush_after=True):
+                logger.warning(f"Failed to send command 0x{request.command:02X}")
+        return None
 
-            if expected_response is None:
-                return None
+    async def _send_and_wait(self, request: Frame, pending: _PendingRequest) -> Frame | None:
+        """Request/response half of `send_and_receive`."""
+        # One bus exchange at a time: the pending slot, the write and the
+        # wait for its response all sit under the same lock.
+        async with self._bus_lock:
+            # Cancel any prior unresolved pending (shouldn't happen — _bus_lock serialises).
+            if (
+                self._pending_request is not None
+                and not self._pending_request.future.done()
+            ):
+                self._pending_request.future.cancel()
+            self._pending_request = pending
+
+            # Check if a buffered response-shape frame already matches this
+            # pending request. Only the buffers for commands it can accept
+            # are scanned; a matched frame is removed, the rest stay for a
+            # future request (still size-capped).
+            self._match_buffered_response(pending.expected_cmd, pending.accept_cmds)
 
-            # Same 2s patience as the pre-refactor loop (10 * 0.2s).
             try:
-                return await asyncio.wait_for(pending.future, timeout=2.0)
-            except TimeoutError:
-                logger.debug(
-                    f"No matching response for 0x{command:02X} within 2.0s"
+                # 20ms RS-485 bus turnaround delay
+                await asyncio.sleep(0.02)
+
+                success = await self._connection.protocol.write_frame(
+                    request, flush_after=True
                 )
-                return None
-        finally:
-            if self._pending_request is pending:
-                self._pending_request = None
+                if not success:
+                    logger.warning(f"Failed to send command 0x{request.command:02X}")
+                    return None
+
+                try:
+                    return await asyncio.wait_for(pending.future, timeout=self._response_timeout)
+                except TimeoutError:
+                    logger.debug(
+                        f"No matching response for 0x{request.command:02X} within {self._response_timeout:.1f}s"
+                    )
+                    return None
+            finally:
+                if self._pending_request is pending:
+                    self._pending_request = None
 
     async def _send_get_settings(self) -> None:
         """Send GET_SETTINGS as first request after receiving token.
@@ -1590,10 +1832,7 @@ class ProtocolHandler:
             expect_cmd = Command.GET_PARAMS_STRUCT_RESPONSE
 
         def validate_first_index(frame: Frame) -> bool:
-            if len(frame.data) < 3:
-                return False
-            first_index = struct.unpack("<H", frame.data[1:3])[0]
-            return first_index == start_index
+            return _U16.unpack_from(frame.data, 1)[0] == start_index
 
         response = await self.send_and_receive(
             send_cmd,
@@ -1602,6 +1841,7 @@ class ProtocolHandler:
             also_accept_commands=[Command.NO_DATA, Command.ERROR],
             response_validator=validate_first_index,
             destination=destination,
+            response_min_len=3,
         )
 
         if response is None:
@@ -1622,8 +1862,7 @@ class ProtocolHandler:
         else:
             entries = parse_struct_response_no_range(response.data)
 
-        for entry in entries:
-            self._param_structs[entry.index] = entry
+        self._param_structs.update(zip(map(_get_index, entries), entries, strict=True))
 
         logger.debug(f"Fetched {len(entries)} param structs starting at index {start_index}")
         return entries, False
@@ -1647,13 +1886,14 @@ class ProtocolHandler:
         Returns:
             List of (stored_index, value) tuples.
         """
-        data = build_get_params_request(start_index, count)
+        key = (start_index, count)
+        data = self._poll_request_cache.get(key)
+        if data is None:
+            data = build_get_params_request(start_index, count)
+            self._poll_request_cache[key] = data
 
         def validate_first_index(frame: Frame) -> bool:
-            if len(frame.data) < 3:
-                return False
-            first_index = struct.unpack("<H", frame.data[1:3])[0]
-            return first_index == start_index
+            return _U16.unpack_from(frame.data, 1)[0] == start_index
 
         response = await self.send_and_receive(
             Command.GET_PARAMS,
@@ -1661,6 +1901,7 @@ class ProtocolHandler:
             expected_response=Command.GET_PARAMS_RESPONSE,
             response_validator=validate_first_index,
             destination=destination,
+            response_min_len=3,
         )
 
         if response is None:
@@ -1691,7 +1932,7 @@ class ProtocolHandler:
             if entry is None or not entry.name:
                 continue
 
-            min_val, max_val = await self._resolve_min_max(entry)
+            min_val, max_val = self._literal_bounds(entry) or await self._resolve_min_max(entry)
             param = Parameter(
                 index=index,
                 name=entry.name,
@@ -1722,6 +1963,80 @@ class ProtocolHandler:
         Raises:
             ValueError: If parameter not found or not writable.
         """
+        results = await self.write_params({name: value})
+        return results[name]
+
+    async def write_params(self, updates: dict[str, Any]) -> dict[str, bool]:
+        """Write several parameter values under a single token grant.
+
+        Every name and value is validated before anything is sent, so a
+        bad entry rejects the whole batch without touching the bus. GM3
+        has no multi-parameter MODIFY frame; the writes go out as
+        back-to-back MODIFY_PARAM exchanges in one token hold, and the
+        acknowledged values land in the cache in one update.
+
+        Args:
+            updates: Mapping of parameter name to new value.
+
+        Returns:
+            Mapping of parameter name to whether its write was acknowledged.
+
+        Raises:
+            ValueError: If any parameter is not found, not writable, or
+                out of range.
+        """
+        prepared: list[tuple[str, Any, Parameter, tuple[bytes, asyncio.Future[bool]]]] = []
+        loop = asyncio.get_running_loop()
+        for name, value in updates.items():
+            param = await self._validate_write(name, value)
+            entry = self._param_structs[param.index]
+            data = build_modify_param_request(param.index, value, entry.type_code)
+            future: asyncio.Future[bool] = loop.create_future()
+            prepared.append((name, value, param, (data, future)))
+
+        if not prepared:
+            return {}
+
+        queued_items = [queued for _, _, _, queued in prepared]
+        self._pending_writes.extend(queued_items)
+
+        try:
+            async with self._traced_lock(f"api:write_params:{','.join(updates)}"):
+                # An earlier lock holder may already have sent these writes
+                if not all(future.done() for _, future in queued_items):
+                    await self._flush_pending_writes()
+            acks = await asyncio.gather(*(future for _, future in queued_items))
+        finally:
+            for queued in queued_items:
+                future = queued[1]
+                if not future.done():
+                    future.cancel()
+                    if queued in self._pending_writes:
+                        self._pending_writes.remove(queued)
+
+        results: dict[str, bool] = {}
+        updated: list[Parameter] = []
+        for (name, value, param, _), acked in zip(prepared, acks, strict=True):
+            results[name] = acked
+            if acked:
+                updated.append(param.model_copy(update={"value": value}))
+                logger.info("Parameter %s set to %s", name, value)
+            else:
+                logger.warning("Failed to write parameter %s", name)
+
+        await self._cache.set_many(updated)
+        return results
+
+    async def _validate_write(self, name: str, value: Any) -> Parameter:
+        """Check that *name* is a known, writable parameter and *value* is in range.
+
+        Returns:
+            The cached Parameter for *name*.
+
+        Raises:
+            ValueError: If the parameter is unknown, read-only or the
+                value is outside its (possibly dynamic) limits.
+        """
         param = await self._cache.get_by_name(name)
         if param is None:
             raise ValueError(f"Parameter not found: {name}")
@@ -1733,7 +2048,7 @@ class ProtocolHandler:
         if not entry.writable:
             raise ValueError(f"Parameter is read-only: {name}")
 
-        min_val, max_val = await self._resolve_min_max(entry)
+        min_val, max_val = self._literal_bounds(entry) or await self._resolve_min_max(entry)
 
         if min_val is not None and float(value) < min_val:
             raise ValueError(f"Value {value} below minimum {min_val} for {name}")
@@ -1741,29 +2056,42 @@ class ProtocolHandler:
         if max_val is not None and float(value) > max_val:
             raise ValueError(f"Value {value} above maximum {max_val} for {name}")
 
-        data = build_modify_param_request(param.index, value, entry.type_code)
+        return param
 
-        async with self._traced_lock(f"api:write_param:{name}"):
-            try:
-                # Must hold the bus token to transmit on the RS-485 bus
-                await self._wait_for_token()
-                response = await self.send_and_receive(
-                    Command.MODIFY_PARAM,
-                    data,
-                    expected_response=Command.MODIFY_PARAM_RESPONSE,
-                )
-            finally:
-                if self._has_token:
-                    await self._return_token()
-
-        if response is not None:
-            updated_param = param.model_copy(update={"value": value})
-            await self._cache.set(updated_param)
-            logger.info("Parameter %s set to %s", name, value)
-            return True
+    async def _flush_pending_writes(self) -> None:
+        """Send every queued MODIFY_PARAM under a single token grant.
 
-        logger.warning("Failed to write parameter %s", name)
-        return False
+        Must be called with `_lock` held. Writes queued by other callers
+        while we wait for the token or the bus are drained too, so a burst
+        of updates costs one token round-trip instead of one per write.
+        Each queued future is resolved with whether its write was acked.
+        """
+        try:
+            # Must hold the bus token to transmit on the RS-485 bus
+            await self._wait_for_token()
+            while self._pending_writes:
+                # Dequeued only once resolved: if we are cancelled mid-send
+                # the write stays queued for the next lock holder.
+                queued = self._pending_writes[0]
+                data, future = queued
+                if not future.done():
+                    try:
+                        response = await self.send_and_receive(
+                            Command.MODIFY_PARAM,
+                            data,
+                            expected_response=Command.MODIFY_PARAM_RESPONSE,
+                        )
+                    except Exception as e:
+                        if not future.done():
+                            future.set_exception(e)
+                    else:
+                        if not future.done():
+                            future.set_result(response is not None)
+                if queued in self._pending_writes:
+                    self._pending_writes.remove(queued)
+        finally:
+            if self._has_token:
+                await self._return_token()
 
     @staticmethod
     def _decode_alarm_date(data: bytes) -> datetime | None:
@@ -1777,16 +2105,7 @@ class ProtocolHandler:
         """
         if len(data) < 7:
             return None
-        if all(b == 0xFF for b in data[:7]):
-            return None
-        try:
-            year = struct.unpack("<h", data[0:2])[0]
-            month, day, hour, minute, second = data[2], data[3], data[4], data[5], data[6]
-            if year < 1 or month < 1 or month > 12 or day < 1 or day > 31:
-                return None
-            return datetime(year=year, month=month, day=day, hour=hour, minute=minute, second=second)
-        except (ValueError, OverflowError):
-            return None
+        return _decode_alarm_date_cached(bytes(data[:7]))
 
     async def read_alarms(self) -> list[Alarm]:
         """Read alarm history from the controller.
@@ -1804,50 +2123,79 @@ class ProtocolHandler:
                 await self._wait_for_token()
 
                 alarm_index = 0
-                while True:
-                    data = ALARM_REQUEST_PREFIX + bytes([alarm_index & 0xFF])
+                end_of_list = False
+                batch = self._alarm_batch_size
+                fallback_index: int | None = None
+                # One request buffer for the whole walk; only the index byte
+                # (and, on fallback, the trailing count byte) changes.
+                index_pos = len(ALARM_REQUEST_PREFIX)
+                request = bytearray(ALARM_REQUEST_PREFIX)
+                request.append(0)
+                if batch > 1:
+                    request.append(batch)
+                while not end_of_list:
+                    request[index_pos] = alarm_index & 0xFF
                     response = await self.send_and_receive(
                         Command.SERVICE,
-                        data,
+                        bytes(request),
                         expected_response=Command.SERVICE_RESPONSE,
                         destination=PANEL_ADDRESS,
                     )
 
-                    if response is None or len(response.data) < 15:
+                    if response is None or len(response.data) < ALARM_RECORD_SIZE:
+                        if batch > 1:
+                            # Retry this index on its own; only a successful
+                            # single-index read makes the downgrade stick.
+                            logger.debug("No reply to batched alarm request at index %d, retrying alone", alarm_index)
+                            batch = 1
+                            fallback_index = alarm_index
+                            del request[index_pos + 1 :]
+                            continue
                         logger.debug("No alarm response at index %d, stopping", alarm_index)
                         break
 
-                    code = response.data[0]
-                    from_date = self._decode_alarm_date(response.data[1:8])
+                    # Single-index replies may carry trailing bytes; only a
+                    # batched request is walked as consecutive records.
+                    records = len(response.data) // ALARM_RECORD_SIZE if batch > 1 else 1
 
-                    if from_date is None:
-                        logger.debug("Null alarm at index %d, end of list", alarm_index)
-                        break
+                    for offset in range(0, records * ALARM_RECORD_SIZE, ALARM_RECORD_SIZE):
+                        code = response.data[offset]
+                        from_date = self._decode_alarm_date(response.data[offset + 1 : offset + 8])
 
-                    to_date = self._decode_alarm_date(response.data[8:15])
+                        if from_date is None:
+                            logger.debug("Null alarm at index %d, end of list", alarm_index)
+                            end_of_list = True
+                            break
 
-                    alarm = Alarm(
-                        index=alarm_index,
-                        code=code,
-                        from_date=from_date,
-                        to_date=to_date,
-                    )
-                    alarms.append(alarm)
-                    logger.debug(
-                        "Alarm #%d: code=%d, from=%s, to=%s",
-                        alarm_index,
-                        code,
-                        from_date,
-                        to_date,
-                    )
-                    alarm_index += 1
+                        to_date = self._decode_alarm_date(response.data[offset + 8 : offset + 15])
+
+                        alarm = Alarm(
+                            index=alarm_index,
+                            code=code,
+                            from_date=from_date,
+                            to_date=to_date,
+                        )
+                        alarms.append(alarm)
+                        logger.debug(
+                            "Alarm #%d: code=%d, from=%s, to=%s",
+                            alarm_index,
+                            code,
+                            from_date,
+                            to_date,
+                        )
+                        alarm_index += 1
+
+                    if fallback_index is not None and alarm_index > fallback_index:
+                        logger.info("Controller ignored alarm batch request, reading one alarm per request")
+                        self._alarm_batch_size = 1
+                        fallback_index = None
 
             finally:
                 if self._has_token:
                     await self._return_token()
 
-        alarms.sort(key=lambda a: a.from_date, reverse=True)
-        self._alarms = alarms
+        alarms.sort(key=_alarm_from_date, reverse=True)
+        self._alarms = tuple(alarms)
         logger.info("Read %d alarms from controller", len(alarms))
         return alarms
 
@@ -1862,7 +2210,7 @@ class ProtocolHandler:
         """Discover all parameters in one address space.
 
         Sends struct requests one at a time in a tight loop until NO_DATA.
-        Retries failed requests up to RETRY_ATTEMPTS times.
+        Retries failed requests with a short exponential backoff.
 
         Args:
             label: Human-readable name for logging ("regulator" or "panel").
@@ -1875,7 +2223,7 @@ class ProtocolHandler:
             True if all params discovered, False if failed.
         """
         wire_index = 0
-        batch_size = 100  # maxNumStructDPParams (matches original)
+        batch_size = self._struct_batch_size
         max_retries = 10  # generous retries - token doesn't expire
         resend_counter = 0
         batches = 0
@@ -1914,15 +2262,17 @@ class ProtocolHandler:
                     resend_counter,
                     max_retries,
                 )
+                delay = min(DISCOVERY_RETRY_MAX, self._discovery_retry_base * 2 ** (resend_counter - 1))
+                await asyncio.sleep(delay * (1 + random.uniform(0, DISCOVERY_RETRY_JITTER)))
                 continue
 
             resend_counter = 0
             batches += 1
 
-            for entry in entries:
-                stored_index = entry.index + store_offset
-                entry.index = stored_index
-                structs[stored_index] = entry
+            if store_offset:
+                for entry in entries:
+                    entry.index += store_offset
+            structs.update(zip(map(_get_index, entries), entries, strict=True))
 
             # Advance to next batch
             last_wire = entries[-1].index - store_offset
@@ -1991,6 +2341,7 @@ class ProtocolHandler:
 
             if new_structs:
                 self._param_structs = new_structs
+                self._poll_request_cache.clear()
                 self._total_params = len(self._param_structs)
                 reg_count = sum(1 for k in new_structs if k < 10000)
                 panel_count = sum(1 for k in new_structs if k >= 10000)
@@ -2065,7 +2416,7 @@ class ProtocolHandler:
                         entry = self._param_structs.get(index)
                         if entry is None or not entry.name:
                             continue
-                        min_val, max_val = await self._resolve_min_max(entry)
+                        min_val, max_val = self._literal_bounds(entry) or await self._resolve_min_max(entry)
                         param = Parameter(
                             index=index,
                             name=entry.name,
@@ -2094,6 +2445,19 @@ class ProtocolHandler:
                 if self._has_token:
                     await self._return_token()
 
+    def _poll_delay(self, consecutive_errors: int) -> float:
+        """Delay before the next poll cycle.
+
+        The plain poll interval after a good cycle; after failures, doubles
+        per consecutive error up to POLL_BACKOFF_MAX, with jitter so many
+        gateways behind a flaky controller don't retry in lockstep.
+        """
+        if consecutive_errors == 0:
+            return self._poll_interval
+        # Exponent clamped: the error count is unbounded during long outages
+        delay = min(POLL_BACKOFF_MAX, self._poll_interval * 2 ** min(consecutive_errors - 1, 16))
+        return delay * (1 + random.uniform(-POLL_BACKOFF_JITTER, POLL_BACKOFF_JITTER))
+
     async def _poll_loop(self) -> None:
         """Background polling loop with reconnection support."""
         consecutive_errors = 0
@@ -2107,7 +2471,8 @@ class ProtocolHandler:
                     if was_connected:
                         logger.warning("Connection lost, waiting for reconnection...")
                         was_connected = False
-                    await asyncio.sleep(self._poll_interval)
+                    # No wakeups while offline; the transport signals reconnect
+                    await self._connection.wait_connected()
                     continue
 
                 if not was_connected:
@@ -2141,6 +2506,6 @@ class ProtocolHandler:
                     logger.error(f"Poll error: {e}")
 
             try:
-                await asyncio.sleep(self._poll_interval)
+                await asyncio.sleep(self._poll_delay(consecutive_errors))
             except asyncio.CancelledError:
                 raise
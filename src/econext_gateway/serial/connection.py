@@ -32,6 +32,9 @@ class GM3SerialTransport:
         self._protocol: GM3Protocol | None = None
         self._transport: asyncio.Transport | None = None
         self._reconnect_task: asyncio.Task | None = None
+        # Set by a successful connect(); lets callers sleep until the port
+        # is back instead of polling `connected`.
+        self._connected_event = asyncio.Event()
 
     @property
     def protocol(self) -> GM3Protocol:
@@ -47,6 +50,17 @@ class GM3SerialTransport:
     def connected(self) -> bool:
         return self._protocol is not None and self._protocol.connected
 
+    async def wait_connected(self) -> None:
+        """Block until the serial port is connected.
+
+        Returns immediately when already connected. The event is re-armed
+        before each wait so a connection lost without disconnect() (the
+        protocol's connection_lost) cannot leave a stale set event behind.
+        """
+        while not self.connected:
+            self._connected_event.clear()
+            await self._connected_event.wait()
+
     # -- connect / disconnect -------------------------------------------------
 
     async def connect(self) -> bool:
@@ -69,6 +83,7 @@ class GM3SerialTransport:
             )
             self._transport = transport
             self._protocol = protocol
+            self._connected_event.set()
 
             logger.info("Successfully connected to %s", self.port)
             return True
@@ -88,6 +103,7 @@ class GM3SerialTransport:
                 logger.error("Error closing serial transport: %s", e)
             self._transport = None
             self._protocol = None
+            self._connected_event.clear()
             logger.info("Disconnected from %s", self.port)
 
     async def reconnect(self) -> bool:
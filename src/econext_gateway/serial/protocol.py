@@ -16,14 +16,15 @@ class GM3Protocol(asyncio.Protocol):
 
     Receives raw bytes via ``data_received()``, extracts complete frames,
     and places them on an asyncio.Queue for consumption by higher layers.
-    Writing is serialised through an asyncio.Lock.
+    ``write_frame`` never awaits while writing, so each frame reaches the
+    transport atomically; request/response pairing is serialised by the
+    protocol handler.
     """
 
     def __init__(self, keep_destinations: set[int] | None = None, panel_address: int = 100) -> None:
         self._transport: asyncio.Transport | None = None
         self._rx_buffer = bytearray()
         self._frame_queue: asyncio.Queue[Frame | None] = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
-        self._write_lock = asyncio.Lock()
         self._connected_event = asyncio.Event()
         self._disconnected_event = asyncio.Event()
         # Whitelist: only queue frames addressed to us. Panel broadcasts
@@ -139,14 +140,19 @@ class GM3Protocol(asyncio.Protocol):
             if len(self._rx_buffer) < frame_length:
                 return None
 
-            frame_data = bytes(self._rx_buffer[:frame_length])
-
-            if frame_data[-1] != END_FRAME:
-                logger.debug("Invalid END marker 0x%02X, discarding BEGIN marker", frame_data[-1])
+            end_byte = self._rx_buffer[frame_length - 1]
+            if end_byte != END_FRAME:
+                logger.debug("Invalid END marker 0x%02X, discarding BEGIN marker", end_byte)
                 del self._rx_buffer[0]
                 self._stats["frames_invalid"] += 1
                 continue
 
+            # Single copy out of the receive buffer: slicing the bytearray
+            # and converting to bytes would copy twice. The temporary view
+            # is released before the buffer is resized below.
+            with memoryview(self._rx_buffer) as view:
+                frame_data = view[:frame_length].tobytes()
+
             frame = Frame.from_bytes(frame_data)
             if frame is None:
                 logger.warning("Frame parse failed (CRC or validation error): %s", frame_data.hex())
@@ -180,6 +186,13 @@ class GM3Protocol(asyncio.Protocol):
         except TimeoutError:
             return None
 
+    def try_receive_frame_nowait(self) -> Frame | None:
+        """Return an already-parsed frame without waiting, or ``None``."""
+        try:
+            return self._frame_queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
     async def write_frame(
         self,
         frame: Frame,
@@ -199,29 +212,28 @@ class GM3Protocol(asyncio.Protocol):
 
         Returns True on success, False when the transport is unavailable.
         """
-        async with self._write_lock:
-            if self._transport is None:
-                return False
-
-            frame_bytes = frame.to_bytes()
-            self._transport.write(frame_bytes)
-            self._stats["frames_written"] += 1
-
-            if flush_after:
-                serial_obj = getattr(self._transport, "serial", None)
-                if serial_obj is not None:
-                    try:
-                        # flush() -- block until TX buffer is drained to wire
-                        serial_obj.flush()
-                        if clear_echo:
-                            # reset_input_buffer() -- discard echo/garbage
-                            # that arrived during transmission
-                            serial_obj.reset_input_buffer()
-                    except Exception as e:
-                        logger.warning("Failed to flush serial port: %s", e)
-
-            logger.debug("Frame written: %s (hex: %s)", frame, frame_bytes.hex())
-            return True
+        if self._transport is None:
+            return False
+
+        frame_bytes = frame.to_bytes()
+        self._transport.write(frame_bytes)
+        self._stats["frames_written"] += 1
+
+        if flush_after:
+            serial_obj = getattr(self._transport, "serial", None)
+            if serial_obj is not None:
+                try:
+                    # flush() -- block until TX buffer is drained to wire
+                    serial_obj.flush()
+                    if clear_echo:
+                        # reset_input_buffer() -- discard echo/garbage
+                        # that arrived during transmission
+                        serial_obj.reset_input_buffer()
+                except Exception as e:
+                    logger.warning("Failed to flush serial port: %s", e)
+
+        logger.debug("Frame written: %s (hex: %s)", frame, frame_bytes.hex())
+        return True
 
     def reset_buffer(self) -> None:
         """Clear the receive buffer and drain any queued frames."""
@@ -4,10 +4,23 @@ from pathlib import Path
 
 import pytest
 
+try:
+    import uvloop
+except ImportError:  # optional extra, see README
+    uvloop = None
+
 # Address used by all tests (outside CLAIMABLE_ADDRESS_RANGE)
 TEST_BUS_ADDRESS = 200
 
 
+if uvloop is not None:
+
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Run async tests on uvloop, like the service, when it is installed."""
+        return uvloop.EventLoopPolicy()
+
+
 @pytest.fixture
 def paired_address_file(tmp_path: Path) -> Path:
     """Create a temporary paired address file for tests."""
@@ -201,6 +201,27 @@ class TestParameterCache:
         by_name = await cache.get_by_name("PS")
         assert by_name is not None
 
+    @pytest.mark.asyncio
+    async def test_get_by_name_tracks_updates_and_renames(self):
+        """Test the name lookup follows value updates, renames and clear."""
+        cache = ParameterCache()
+        await cache.set(make_param("PS", index=0, value=1))
+        await cache.set(make_param("PS", index=10010, value=2))
+        await cache.set(make_param("PS", index=0, value=3))
+
+        by_name = await cache.get_by_name("PS")
+        assert by_name is not None and by_name.index == 0 and by_name.value == 3
+
+        # Rediscovery renamed index 0: the panel entry becomes the first "PS"
+        await cache.set(make_param("Pump", index=0, value=3))
+        renamed = await cache.get_by_name("Pump")
+        by_name = await cache.get_by_name("PS")
+        assert renamed is not None and renamed.index == 0
+        assert by_name is not None and by_name.index == 10010
+
+        await cache.clear()
+        assert await cache.get_by_name("PS") is None
+
     @pytest.mark.asyncio
     async def test_concurrent_access(self):
         """Test cache is safe under concurrent access."""
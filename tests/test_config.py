@@ -23,6 +23,8 @@ class TestSettings:
         assert settings.request_timeout == 1.5
         assert settings.destination_address == 1
         assert settings.params_per_request == 100
+        assert settings.alarm_batch_size == 1
+        assert settings.struct_batch_size == 100
 
     def test_env_override_serial_port(self):
         """Test serial port override from environment."""
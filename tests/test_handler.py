@@ -2,15 +2,19 @@
 
 import asyncio
 import struct
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from econext_gateway.core.cache import ParameterCache
 from econext_gateway.core.models import Alarm, Parameter
+from econext_gateway.protocol.codec import decode_value, encode_value
 from econext_gateway.protocol.constants import (
     ALARM_REQUEST_PREFIX,
+    GET_TOKEN_FUNC,
     PANEL_ADDRESS,
+    POLL_BACKOFF_JITTER,
+    POLL_BACKOFF_MAX,
     Command,
     DataType,
 )
@@ -26,12 +30,75 @@ from econext_gateway.protocol.handler import (
     parse_get_params_response,
     parse_struct_response,
 )
-from econext_gateway.serial.connection import GM3SerialTransport
-from econext_gateway.serial.protocol import GM3Protocol
 
 # Must match conftest.TEST_BUS_ADDRESS
 TEST_BUS_ADDRESS = 200
 
+
+class _FakeProtocol:
+    """Plain stand-in for GM3Protocol.
+
+    Avoids MagicMock spec introspection on every handler construction.
+    Tests override ``write_frame`` by assigning a coroutine function to
+    the instance attribute; responses are fed through ``_route_inbound``.
+    """
+
+    def __init__(self) -> None:
+        self.written: list[Frame] = []
+
+    async def write_frame(self, frame: Frame, flush_after: bool = False, clear_echo: bool = True) -> bool:
+        self.written.append(frame)
+        return True
+
+    async def receive_frame(self, timeout: float | None = None) -> Frame | None:
+        return None
+
+    def try_receive_frame_nowait(self) -> Frame | None:
+        return None
+
+    def reset_buffer(self) -> None:
+        pass
+
+
+class _FakeConnection:
+    """Plain stand-in for GM3SerialTransport with a settable ``connected``."""
+
+    def __init__(self) -> None:
+        self._connected = asyncio.Event()
+        self._connected.set()
+        self.protocol = _FakeProtocol()
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    @connected.setter
+    def connected(self, value: bool) -> None:
+        if value:
+            self._connected.set()
+        else:
+            self._connected.clear()
+
+    async def wait_connected(self) -> None:
+        await self._connected.wait()
+
+
+def _make_handler(paired_address_file, **kwargs) -> tuple[ProtocolHandler, _FakeConnection, ParameterCache]:
+    """Create a handler on a fake connection, with no discovery backoff sleeps."""
+    conn = _FakeConnection()
+    cache = ParameterCache()
+    options = {
+        "poll_interval": 1.0,
+        "request_timeout": 0.5,
+        "token_timeout": 0,
+        "token_required": False,
+        "paired_address_file": paired_address_file,
+        "discovery_retry_base": 0.0,
+        **kwargs,
+    }
+    return ProtocolHandler(connection=conn, cache=cache, **options), conn, cache
+
+
 # ============================================================================
 # Test Parse Functions
 # ============================================================================
@@ -133,6 +200,57 @@ class TestParseGetParamsResponse:
         assert len(results) == 1
         assert results[0] == (0, 42)
 
+    def test_truncated_batch_returns_complete_values(self):
+        """Test a response cut off mid-batch yields the values that fit."""
+        structs = {
+            i: ParamStructEntry(index=i, name=f"P{i}", unit=0, type_code=DataType.INT16, writable=False)
+            for i in range(3)
+        }
+
+        data = struct.pack("<BH", 3, 0)
+        data += b"\xc2" + struct.pack("<h", 1)
+        data += b"\xc2" + struct.pack("<h", 2)
+        data += b"\xc2" + b"\x03"  # third value truncated
+
+        results = parse_get_params_response(data, structs)
+
+        assert results == [(0, 1), (1, 2)]
+
+    def test_full_poll_window_of_one_type(self):
+        """Test a full 100-value window decodes through the compiled batch layout."""
+        structs = {
+            i: ParamStructEntry(index=i, name=f"T{i}", unit=1, type_code=DataType.FLOAT, writable=False)
+            for i in range(200, 300)
+        }
+        values = [i / 4 for i in range(100)]
+
+        data = struct.pack("<BH", 100, 200)
+        for v in values:
+            data += b"\xc2" + struct.pack("<f", v)
+
+        results = parse_get_params_response(data, structs)
+
+        assert results == [(200 + i, round(v, 2)) for i, v in enumerate(values)]
+
+    def test_string_mid_batch_after_fixed_prefix(self):
+        """Test fixed-size values before a STRING decode, then the walk resumes."""
+        structs = {
+            0: ParamStructEntry(index=0, name="A", unit=0, type_code=DataType.INT16, writable=False),
+            1: ParamStructEntry(index=1, name="B", unit=0, type_code=DataType.BOOL, writable=False),
+            2: ParamStructEntry(index=2, name="S", unit=0, type_code=DataType.STRING, writable=False),
+            3: ParamStructEntry(index=3, name="C", unit=0, type_code=DataType.UINT8, writable=False),
+        }
+
+        data = struct.pack("<BH", 4, 0)
+        data += b"\xc2" + struct.pack("<h", -7)
+        data += b"\xc2" + b"\x01"
+        data += b"\xc2" + b"abc\x00"
+        data += b"\xc2" + b"\x09"
+
+        results = parse_get_params_response(data, structs)
+
+        assert results == [(0, -7), (1, True), (2, "abc"), (3, 9)]
+
     def test_too_short_response(self):
         """Test parsing too-short response."""
         with pytest.raises(ValueError, match="too short"):
@@ -184,6 +302,34 @@ class TestParseGetParamsResponse:
         assert results[1] == (1, 42)
         assert results[2] == (2, 99999)
 
+    @pytest.mark.parametrize(
+        "value,type_code",
+        [
+            (-5, DataType.INT8),
+            (-1234, DataType.INT16),
+            (-123456, DataType.INT32),
+            (-(2**40), DataType.INT64),
+            (250, DataType.UINT8),
+            (60000, DataType.UINT16),
+            (4000000000, DataType.UINT32),
+            (2**60, DataType.UINT64),
+            (21.456, DataType.FLOAT),
+            (-3.14159, DataType.DOUBLE),
+            (0, DataType.BOOL),
+            (7, DataType.BOOL),
+        ],
+    )
+    def test_fixed_types_match_codec(self, value, type_code):
+        """Test precompiled per-type layouts decode exactly like codec.decode_value."""
+        structs = {0: ParamStructEntry(index=0, name="X", unit=0, type_code=type_code, writable=False)}
+        raw = encode_value(value, type_code) if type_code != DataType.BOOL else bytes([value])
+
+        data = struct.pack("<BH", 1, 0) + b"\xc2" + raw
+        results = parse_get_params_response(data, structs)
+
+        assert results == [(0, decode_value(raw, type_code))]
+        assert type(results[0][1]) is type(decode_value(raw, type_code))
+
 
 class TestParseStructResponse:
     """Tests for parse_struct_response."""
@@ -239,6 +385,21 @@ class TestParseStructResponse:
         assert entries[1].type_code == 10  # BOOL
         assert entries[1].writable is True
 
+    def test_non_ascii_name_and_truncated_tail(self):
+        """Test names are decoded leniently and a missing terminator ends parsing."""
+        data = struct.pack("<BH", 2, 0)
+        data += "Temp_°".encode() + b"\xff\x00"  # UTF-8 plus a stray byte
+        data += b"C\x00"
+        data += struct.pack("<BB", 0x02, 0xC0)
+        data += struct.pack("<hh", 0, 0)
+        data += b"Unterminated"  # second name has no null terminator
+
+        entries = parse_struct_response(data)
+
+        assert len(entries) == 1
+        assert entries[0].name == "Temp_°\ufffd"
+        assert entries[0].unit == 1
+
     def test_no_range_flags(self):
         """Test parsing with range flags indicating no min/max."""
         data = struct.pack("<BH", 1, 0)
@@ -349,6 +510,32 @@ class TestBuildFunctions:
         assert struct.unpack("<H", data[15:17])[0] == 5
         assert data[17] == 1
 
+    @pytest.mark.parametrize(
+        "value,type_code",
+        [
+            (-5, DataType.INT8),
+            (45.0, DataType.INT16),
+            (-123456, DataType.INT32),
+            (-(2**40), DataType.INT64),
+            (250, DataType.UINT8),
+            (60000, DataType.UINT16),
+            (4000000000, DataType.UINT32),
+            (2**60, DataType.UINT64),
+            (21, DataType.FLOAT),
+            (-3.14159, DataType.DOUBLE),
+            (0, DataType.BOOL),
+            ("yes", DataType.BOOL),
+            ("eco", DataType.STRING),
+        ],
+    )
+    def test_build_modify_param_matches_codec(self, value, type_code):
+        """Test the one-call packers produce header + codec.encode_value bytes."""
+        header = b"USER-000\x004096\x00" + b"\x01" + struct.pack("<H", 300)
+
+        data = build_modify_param_request(index=300, value=value, type_code=type_code)
+
+        assert data == header + encode_value(value, type_code)
+
 
 # ============================================================================
 # Test ProtocolHandler
@@ -364,25 +551,9 @@ class TestProtocolHandler:
     def _paired_file(self, paired_address_file):
         self._paired_address_file = paired_address_file
 
-    def _make_handler(self) -> tuple[ProtocolHandler, MagicMock, ParameterCache]:
-        """Create handler with mocked connection."""
-        conn = MagicMock(spec=GM3SerialTransport)
-        conn.connected = True
-        conn.protocol = MagicMock(spec=GM3Protocol)
-        conn.protocol.write_frame = AsyncMock(return_value=True)
-        conn.protocol.receive_frame = AsyncMock(return_value=None)
-        conn.protocol.reset_buffer = MagicMock()
-        cache = ParameterCache()
-        handler = ProtocolHandler(
-            connection=conn,
-            cache=cache,
-            poll_interval=1.0,
-            request_timeout=0.5,
-            token_timeout=0,
-            token_required=False,
-            paired_address_file=self._paired_address_file,
-        )
-        return handler, conn, cache
+    def _make_handler(self, **kwargs) -> tuple[ProtocolHandler, _FakeConnection, ParameterCache]:
+        """Create handler with a fake connection."""
+        return _make_handler(self._paired_address_file, **kwargs)
 
     def _response_frame(self, command: int, data: bytes = b"") -> Frame:
         """Create a mock response frame from the controller."""
@@ -417,7 +588,6 @@ class TestProtocolHandler:
         handler, conn, cache = self._make_handler()
 
         response_frame = self._response_frame(Command.GET_PARAMS_RESPONSE, b"\x01\x00\x00\x2d\x00")
-        handler._connection.protocol.write_frame = AsyncMock(return_value=True)
 
         async def deliver():
             await asyncio.sleep(0.01)
@@ -440,7 +610,10 @@ class TestProtocolHandler:
         """Test send failure."""
         handler, conn, cache = self._make_handler()
 
-        handler._connection.protocol.write_frame = AsyncMock(return_value=False)
+        async def failing_write(*args, **kwargs):
+            return False
+
+        conn.protocol.write_frame = failing_write
 
         result = await handler.send_and_receive(
             Command.GET_PARAMS,
@@ -453,15 +626,7 @@ class TestProtocolHandler:
     @pytest.mark.asyncio
     async def test_send_and_receive_timeout(self):
         """Test receive timeout when bus is silent."""
-        handler, conn, cache = self._make_handler()
-        handler._request_timeout = 0.05  # Short timeout for test speed
-
-        async def simulated_read(*args, **kwargs):
-            await asyncio.sleep(0.02)
-            return None
-
-        handler._connection.protocol.write_frame = AsyncMock(return_value=True)
-        handler._connection.protocol.receive_frame = AsyncMock(side_effect=simulated_read)
+        handler, conn, cache = self._make_handler(response_timeout=0.05)
 
         result = await handler.send_and_receive(
             Command.GET_PARAMS,
@@ -474,30 +639,27 @@ class TestProtocolHandler:
     @pytest.mark.asyncio
     async def test_send_and_receive_wrong_command(self):
         """Test that wrong command frames are skipped until timeout."""
-        handler, conn, cache = self._make_handler()
-        handler._request_timeout = 0.05
+        handler, conn, cache = self._make_handler(response_timeout=0.05)
 
         wrong_response = self._response_frame(Command.GET_SETTINGS_RESPONSE)
-        call_count = 0
+        routed = []
 
-        async def read_wrong_then_silent(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count <= 2:
-                return wrong_response
-            await asyncio.sleep(0.02)
-            return None
-
-        handler._connection.protocol.write_frame = AsyncMock(return_value=True)
-        handler._connection.protocol.receive_frame = AsyncMock(side_effect=read_wrong_then_silent)
+        async def deliver():
+            await asyncio.sleep(0.01)
+            for _ in range(2):
+                routed.append(await handler._route_inbound(wrong_response))
 
-        result = await handler.send_and_receive(
-            Command.GET_PARAMS,
-            b"\x01\x00\x00",
-            expected_response=Command.GET_PARAMS_RESPONSE,
+        result, _ = await asyncio.gather(
+            handler.send_and_receive(
+                Command.GET_PARAMS,
+                b"\x01\x00\x00",
+                expected_response=Command.GET_PARAMS_RESPONSE,
+            ),
+            deliver(),
         )
 
         assert result is None
+        assert routed == [False, False]
 
     @pytest.mark.asyncio
     async def test_fetch_param_structs(self):
@@ -512,7 +674,6 @@ class TestProtocolHandler:
         response_data += struct.pack("<hh", 0, 100)
 
         response_frame = self._response_frame(Command.GET_PARAMS_STRUCT_WITH_RANGE_RESPONSE, response_data)
-        handler._connection.protocol.write_frame = AsyncMock(return_value=True)
 
         async def deliver():
             await asyncio.sleep(0.01)
@@ -535,7 +696,6 @@ class TestProtocolHandler:
         handler, conn, cache = self._make_handler()
 
         no_data_frame = self._response_frame(Command.NO_DATA, b"")
-        handler._connection.protocol.write_frame = AsyncMock(return_value=True)
 
         async def deliver():
             await asyncio.sleep(0.01)
@@ -565,7 +725,6 @@ class TestProtocolHandler:
         response_data += b"\xc2" + struct.pack("<B", 80)  # sep + Pressure = 80
 
         response_frame = self._response_frame(Command.GET_PARAMS_RESPONSE, response_data)
-        handler._connection.protocol.write_frame = AsyncMock(return_value=True)
 
         async def deliver():
             await asyncio.sleep(0.01)
@@ -580,6 +739,28 @@ class TestProtocolHandler:
         assert results[0] == (0, 55)
         assert results[1] == (1, 80)
 
+    @pytest.mark.asyncio
+    async def test_fetch_param_values_reuses_request_body(self):
+        """Test the GET_PARAMS body for a (start, count) pair is built once."""
+        handler, conn, cache = self._make_handler()
+        handler._param_structs = {
+            0: ParamStructEntry(index=0, name="Temp", unit=1, type_code=DataType.INT16, writable=True),
+        }
+        response_frame = self._response_frame(
+            Command.GET_PARAMS_RESPONSE, struct.pack("<BH", 1, 0) + b"\xc2" + struct.pack("<h", 55)
+        )
+
+        async def deliver():
+            await asyncio.sleep(0.01)
+            await handler._route_inbound(response_frame)
+
+        for _ in range(2):
+            await asyncio.gather(handler.fetch_param_values(0, 1), deliver())
+
+        assert list(handler._poll_request_cache) == [(0, 1)]
+        assert conn.protocol.written[0].data is conn.protocol.written[1].data
+        assert conn.protocol.written[0].data == build_get_params_request(0, 1)
+
     @pytest.mark.asyncio
     async def test_read_params_updates_cache(self):
         """Test that read_params updates the cache."""
@@ -599,7 +780,6 @@ class TestProtocolHandler:
 
         response_data = struct.pack("<BH", 1, 0) + b"\xc2" + struct.pack("<h", 65)
         response_frame = self._response_frame(Command.GET_PARAMS_RESPONSE, response_data)
-        handler._connection.protocol.write_frame = AsyncMock(return_value=True)
 
         async def deliver():
             await asyncio.sleep(0.01)
@@ -651,7 +831,6 @@ class TestProtocolHandler:
         )
 
         response_frame = self._response_frame(Command.MODIFY_PARAM_RESPONSE)
-        handler._connection.protocol.write_frame = AsyncMock(return_value=True)
 
         async def deliver():
             await asyncio.sleep(0.01)
@@ -769,10 +948,33 @@ class TestProtocolHandler:
         with pytest.raises(ValueError, match="above maximum"):
             await handler.write_param("Temp", 100)
 
+    @pytest.mark.asyncio
+    async def test_write_param_literal_bounds_skip_resolver(self):
+        """Test literal-only bounds are checked without calling _resolve_min_max."""
+        handler, conn, cache = self._make_handler()
+
+        handler._param_structs = {
+            0: ParamStructEntry(
+                index=0,
+                name="Temp",
+                unit=1,
+                type_code=DataType.INT16,
+                writable=True,
+                min_value=20.0,
+                max_value=80.0,
+            ),
+        }
+        await cache.set(Parameter(index=0, name="Temp", value=50, type=2, unit=1, writable=True))
+        handler._resolve_min_max = AsyncMock(side_effect=AssertionError("should not be called"))
+
+        with pytest.raises(ValueError, match="below minimum 20.0"):
+            await handler.write_param("Temp", 10)
+        handler._resolve_min_max.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_write_param_timeout(self):
         """Test write with no response returns False."""
-        handler, conn, cache = self._make_handler()
+        handler, conn, cache = self._make_handler(response_timeout=0.05)
 
         handler._param_structs = {
             0: ParamStructEntry(
@@ -794,15 +996,6 @@ class TestProtocolHandler:
             )
         )
 
-        handler._request_timeout = 0.05
-
-        async def simulated_read(*args, **kwargs):
-            await asyncio.sleep(0.02)
-            return None
-
-        handler._connection.protocol.write_frame = AsyncMock(return_value=True)
-        handler._connection.protocol.receive_frame = AsyncMock(side_effect=simulated_read)
-
         result = await handler.write_param("Temp", 60)
 
         assert result is False
@@ -814,8 +1007,7 @@ class TestProtocolHandler:
     @pytest.mark.asyncio
     async def test_write_param_acquires_and_returns_token(self):
         """Test that write_param waits for token and returns it after."""
-        conn = MagicMock(spec=GM3SerialTransport)
-        conn.connected = True
+        conn = _FakeConnection()
         cache = ParameterCache()
         handler = ProtocolHandler(
             connection=conn,
@@ -853,7 +1045,7 @@ class TestProtocolHandler:
 
         # Mock _wait_for_token to simulate receiving token
         async def mock_wait_for_token():
-            handler._has_token = True
+            handler._token_event.set()
 
         handler._wait_for_token = mock_wait_for_token
 
@@ -869,7 +1061,6 @@ class TestProtocolHandler:
         handler._return_token = mock_return_token
 
         response_frame = self._response_frame(Command.MODIFY_PARAM_RESPONSE)
-        handler._connection.protocol.write_frame = AsyncMock(return_value=True)
 
         async def deliver():
             await asyncio.sleep(0.01)
@@ -884,17 +1075,103 @@ class TestProtocolHandler:
         assert return_token_called is True
         assert handler._has_token is False
 
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_share_one_token_grant(self):
+        """Test writes queued while the token is awaited are sent under the same grant."""
+        handler, conn, cache = self._make_handler()
+        handler._param_structs = {
+            0: ParamStructEntry(index=0, name="A", unit=1, type_code=DataType.INT16, writable=True),
+            1: ParamStructEntry(index=1, name="B", unit=1, type_code=DataType.INT16, writable=True),
+        }
+        await cache.set(Parameter(index=0, name="A", value=1, type=2, unit=1, writable=True))
+        await cache.set(Parameter(index=1, name="B", value=2, type=2, unit=1, writable=True))
+
+        token_waits = 0
+
+        async def mock_wait_for_token():
+            nonlocal token_waits
+            token_waits += 1
+            await asyncio.sleep(0.02)
+            handler._token_event.set()
+
+        handler._wait_for_token = mock_wait_for_token
+
+        def modify_frames():
+            return [f for f in conn.protocol.written if f.command == Command.MODIFY_PARAM]
+
+        async def ack_each_write():
+            for n in (1, 2):
+                while len(modify_frames()) < n:
+                    await asyncio.sleep(0.005)
+                await handler._route_inbound(self._response_frame(Command.MODIFY_PARAM_RESPONSE))
+
+        a, b, _ = await asyncio.gather(
+            handler.write_param("A", 10),
+            handler.write_param("B", 20),
+            ack_each_write(),
+        )
+
+        assert a is True and b is True
+        assert token_waits == 1
+        assert len(modify_frames()) == 2
+        assert (await cache.get(0)).value == 10
+        assert (await cache.get(1)).value == 20
+        assert handler._pending_writes == []
+
+    @pytest.mark.asyncio
+    async def test_write_params_sends_batch_in_one_grant(self):
+        """Test write_params sends every write under one token and reports each ack."""
+        handler, conn, cache = self._make_handler(response_timeout=0.05)
+        handler._param_structs = {
+            0: ParamStructEntry(index=0, name="A", unit=1, type_code=DataType.INT16, writable=True),
+            1: ParamStructEntry(index=1, name="B", unit=1, type_code=DataType.INT16, writable=True),
+        }
+        await cache.set(Parameter(index=0, name="A", value=1, type=2, unit=1, writable=True))
+        await cache.set(Parameter(index=1, name="B", value=2, type=2, unit=1, writable=True))
+        handler._token_event.set()
+
+        async def ack_first_only():
+            while not conn.protocol.written:
+                await asyncio.sleep(0.005)
+            await handler._route_inbound(self._response_frame(Command.MODIFY_PARAM_RESPONSE))
+
+        results, _ = await asyncio.gather(handler.write_params({"A": 10, "B": 20}), ack_first_only())
+
+        assert results == {"A": True, "B": False}
+        assert [f.command for f in conn.protocol.written].count(Command.MODIFY_PARAM) == 2
+        assert (await cache.get(0)).value == 10
+        assert (await cache.get(1)).value == 2
+        assert handler._pending_writes == []
+
+    @pytest.mark.asyncio
+    async def test_write_params_validates_before_sending(self):
+        """Test one invalid entry rejects the whole batch without touching the bus."""
+        handler, conn, cache = self._make_handler()
+        handler._param_structs = {
+            0: ParamStructEntry(index=0, name="A", unit=1, type_code=DataType.INT16, writable=True),
+            1: ParamStructEntry(index=1, name="RO", unit=1, type_code=DataType.INT16, writable=False),
+        }
+        await cache.set(Parameter(index=0, name="A", value=1, type=2, unit=1, writable=True))
+        await cache.set(Parameter(index=1, name="RO", value=2, type=2, unit=1, writable=False))
+
+        with pytest.raises(ValueError, match="read-only"):
+            await handler.write_params({"A": 10, "RO": 20})
+
+        assert conn.protocol.written == []
+        assert handler._pending_writes == []
+        assert (await cache.get(0)).value == 1
+
     @pytest.mark.asyncio
     async def test_write_param_returns_token_on_failure(self):
         """Test that token is returned even when write fails."""
-        conn = MagicMock(spec=GM3SerialTransport)
-        conn.connected = True
+        conn = _FakeConnection()
         cache = ParameterCache()
         handler = ProtocolHandler(
             connection=conn,
             cache=cache,
             poll_interval=1.0,
             request_timeout=0.05,
+            response_timeout=0.05,
             token_timeout=5.0,
             token_required=True,
             paired_address_file=self._paired_address_file,
@@ -921,7 +1198,7 @@ class TestProtocolHandler:
         )
 
         async def mock_wait_for_token():
-            handler._has_token = True
+            handler._token_event.set()
 
         handler._wait_for_token = mock_wait_for_token
 
@@ -930,20 +1207,42 @@ class TestProtocolHandler:
         async def mock_return_token():
             nonlocal return_token_called
             return_token_called = True
-            handler._has_token = False
+            handler._token_event.clear()
 
         handler._return_token = mock_return_token
 
-        # Simulate no response (timeout)
-        handler._connection.protocol.write_frame = AsyncMock(return_value=True)
-        handler._connection.protocol.receive_frame = AsyncMock(return_value=None)
-
+        # Simulate no response (timeout): the fake never delivers a frame
         result = await handler.write_param("Temp", 60)
 
         assert result is False
         assert return_token_called is True
         assert handler._has_token is False
 
+    @pytest.mark.asyncio
+    async def test_token_grant_wakes_all_waiters(self):
+        """Test one SERVICE/GET_TOKEN frame releases every pending token waiter."""
+        handler, conn, cache = self._make_handler()
+        handler._token_required = True
+
+        waiters = [asyncio.create_task(handler._wait_for_token()) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        assert not any(w.done() for w in waiters)
+
+        grant = Frame(
+            destination=TEST_BUS_ADDRESS,
+            command=Command.SERVICE,
+            data=struct.pack("<H", GET_TOKEN_FUNC) + b"\x00\x00",
+        )
+        grant.source = PANEL_ADDRESS
+        await handler._handle_panel_frame(grant)
+
+        await asyncio.wait_for(asyncio.gather(*waiters), timeout=1.0)
+        assert handler._has_token is True
+
+        await handler._return_token()
+        assert handler._has_token is False
+        assert handler._token_event.is_set() is False
+
     @pytest.mark.asyncio
     async def test_build_modify_param_auth_header(self):
         """Test that auth header matches original webserver format."""
@@ -1084,7 +1383,7 @@ class TestProtocolHandler:
                 return [], True  # NO_DATA
 
         handler.fetch_param_structs = mock_fetch_structs
-        handler._has_token = True
+        handler._token_event.set()
 
         total = await handler.discover_params()
 
@@ -1107,7 +1406,6 @@ class TestProtocolHandler:
         response_data += b"\xc2" + struct.pack("<B", 99)
 
         response_frame = self._response_frame(Command.GET_PARAMS_RESPONSE, response_data)
-        handler._connection.protocol.write_frame = AsyncMock(return_value=True)
 
         async def deliver():
             await asyncio.sleep(0.01)
@@ -1146,8 +1444,6 @@ class TestProtocolHandler:
         response2_data += b"\xc2" + struct.pack("<h", 40)
         response2 = self._response_frame(Command.GET_PARAMS_RESPONSE, response2_data)
 
-        handler._connection.protocol.write_frame = AsyncMock(return_value=True)
-
         # Each send_and_receive call needs its own response delivered. The
         # handler makes 2 requests for this test (partial response forces
         # a second batch). We schedule delivery by watching write_frame calls.
@@ -1193,8 +1489,6 @@ class TestProtocolHandler:
         """Test send without expecting response (fire-and-forget)."""
         handler, conn, cache = self._make_handler()
 
-        handler._connection.protocol.write_frame = AsyncMock(return_value=True)
-
         result = await handler.send_and_receive(
             Command.GET_PARAMS,
             b"\x01\x00\x00",
@@ -1202,7 +1496,69 @@ class TestProtocolHandler:
         )
 
         assert result is None
-        handler._connection.protocol.write_frame.assert_called_once()
+        assert len(conn.protocol.written) == 1
+
+    @pytest.mark.asyncio
+    async def test_send_only_leaves_buffered_responses(self):
+        """Test fire-and-forget sends neither register a pending request nor consume buffers."""
+        handler, conn, cache = self._make_handler()
+        early = self._response_frame(Command.NO_DATA)
+        assert await handler._route_inbound(early) is False
+
+        send = asyncio.create_task(
+            handler.send_and_receive(Command.GET_PARAMS, b"\x01\x00\x00", also_accept_commands=[Command.NO_DATA])
+        )
+        await asyncio.sleep(0)
+        assert handler._pending_request is None
+        assert await send is None
+
+        assert list(handler._unmatched_responses[Command.NO_DATA]) == [early]
+
+    @pytest.mark.asyncio
+    async def test_send_and_receive_uses_early_buffered_response(self):
+        """Test a response routed before the request is picked up from the per-command buffer."""
+        handler, conn, cache = self._make_handler()
+        early = self._response_frame(Command.GET_PARAMS_RESPONSE, struct.pack("<BH", 1, 0))
+        unrelated = self._response_frame(Command.GET_SETTINGS_RESPONSE)
+
+        assert await handler._route_inbound(unrelated) is False
+        assert await handler._route_inbound(early) is False
+
+        result = await handler.send_and_receive(
+            Command.GET_PARAMS, b"\x01\x00\x00", expected_response=Command.GET_PARAMS_RESPONSE
+        )
+
+        assert result is early
+        assert not handler._unmatched_responses[Command.GET_PARAMS_RESPONSE]
+        assert list(handler._unmatched_responses[Command.GET_SETTINGS_RESPONSE]) == [unrelated]
+
+    @pytest.mark.asyncio
+    async def test_send_and_receive_serialises_exchanges(self):
+        """Test a second request is not written until the first one is answered."""
+        handler, conn, cache = self._make_handler()
+        first = self._response_frame(Command.GET_PARAMS_RESPONSE, struct.pack("<BH", 1, 0))
+        second = self._response_frame(Command.GET_PARAMS_RESPONSE, struct.pack("<BH", 1, 5))
+
+        async def deliver():
+            await asyncio.sleep(0.05)
+            assert len(conn.protocol.written) == 1
+            await handler._route_inbound(first)
+            await asyncio.sleep(0.05)
+            await handler._route_inbound(second)
+
+        r1, r2, _ = await asyncio.gather(
+            handler.send_and_receive(
+                Command.GET_PARAMS, b"\x01\x00\x00", expected_response=Command.GET_PARAMS_RESPONSE
+            ),
+            handler.send_and_receive(
+                Command.GET_PARAMS, b"\x01\x05\x00", expected_response=Command.GET_PARAMS_RESPONSE
+            ),
+            deliver(),
+        )
+
+        assert r1 is first
+        assert r2 is second
+        assert len(conn.protocol.written) == 2
 
     @pytest.mark.asyncio
     async def test_discover_params_keeps_existing_on_failure(self):
@@ -1298,6 +1654,17 @@ class TestProtocolHandler:
         # Should have retried after ConnectionError
         assert call_count >= 3
 
+    def test_poll_delay_backs_off_on_errors(self):
+        """Test poll delay doubles per consecutive error, capped and jittered."""
+        handler, conn, cache = self._make_handler()
+        handler._poll_interval = 10.0
+
+        assert handler._poll_delay(0) == 10.0
+        assert 8.5 <= handler._poll_delay(1) <= 11.5
+        assert 34.0 <= handler._poll_delay(3) <= 46.0
+        # Capped, and no overflow after a very long outage
+        assert handler._poll_delay(5000) <= POLL_BACKOFF_MAX * (1 + POLL_BACKOFF_JITTER)
+
     @pytest.mark.asyncio
     async def test_poll_loop_handles_generic_exception(self):
         """Test that poll loop handles unexpected exceptions without crashing."""
@@ -1336,8 +1703,6 @@ class TestProtocolHandler:
         rejected_frame = self._response_frame(Command.GET_PARAMS_RESPONSE, b"\x01\x64\x00")
         accepted_frame = self._response_frame(Command.GET_PARAMS_RESPONSE, b"\x01\x00\x00\x2d\x00")
 
-        handler._connection.protocol.write_frame = AsyncMock(return_value=True)
-
         def validator(frame: Frame) -> bool:
             first_index = struct.unpack("<H", frame.data[1:3])[0]
             return first_index == 0
@@ -1360,6 +1725,38 @@ class TestProtocolHandler:
         assert result is not None
         assert result is accepted_frame
 
+    @pytest.mark.asyncio
+    async def test_send_and_receive_min_len_skips_validator(self):
+        """Frames shorter than response_min_len never reach the validator."""
+        handler, conn, cache = self._make_handler()
+
+        short_frame = self._response_frame(Command.GET_PARAMS_RESPONSE, b"\x01")
+        accepted_frame = self._response_frame(Command.GET_PARAMS_RESPONSE, b"\x01\x00\x00")
+        seen: list[Frame] = []
+
+        def validator(frame: Frame) -> bool:
+            seen.append(frame)
+            return True
+
+        async def deliver():
+            await asyncio.sleep(0.01)
+            await handler._route_inbound(short_frame)
+            await handler._route_inbound(accepted_frame)
+
+        result, _ = await asyncio.gather(
+            handler.send_and_receive(
+                Command.GET_PARAMS,
+                b"\x01\x00\x00",
+                expected_response=Command.GET_PARAMS_RESPONSE,
+                response_validator=validator,
+                response_min_len=3,
+            ),
+            deliver(),
+        )
+
+        assert result is accepted_frame
+        assert seen == [accepted_frame]
+
     @pytest.mark.asyncio
     async def test_fetch_param_values_skips_wrong_first_index(self):
         """Test that fetch_param_values skips responses with mismatched firstIndex."""
@@ -1377,8 +1774,6 @@ class TestProtocolHandler:
         correct_response_data = struct.pack("<BH", 1, 0) + b"\xc2" + struct.pack("<h", 42)
         correct_frame = self._response_frame(Command.GET_PARAMS_RESPONSE, correct_response_data)
 
-        handler._connection.protocol.write_frame = AsyncMock(return_value=True)
-
         async def deliver():
             await asyncio.sleep(0.01)
             await handler._route_inbound(wrong_frame)
@@ -1411,8 +1806,6 @@ class TestProtocolHandler:
         correct_data += struct.pack("<hh", 0, 100)
         correct_frame = self._response_frame(Command.GET_PARAMS_STRUCT_WITH_RANGE_RESPONSE, correct_data)
 
-        handler._connection.protocol.write_frame = AsyncMock(return_value=True)
-
         async def deliver():
             await asyncio.sleep(0.01)
             await handler._route_inbound(wrong_frame)
@@ -1443,20 +1836,8 @@ class TestDiscoverAddressSpace:
     def _paired_file(self, paired_address_file):
         self._paired_address_file = paired_address_file
 
-    def _make_handler(self) -> tuple[ProtocolHandler, MagicMock, ParameterCache]:
-        conn = MagicMock(spec=GM3SerialTransport)
-        conn.connected = True
-        cache = ParameterCache()
-        handler = ProtocolHandler(
-            connection=conn,
-            cache=cache,
-            poll_interval=1.0,
-            request_timeout=0.5,
-            token_timeout=0,
-            token_required=False,
-            paired_address_file=self._paired_address_file,
-        )
-        return handler, conn, cache
+    def _make_handler(self, **kwargs) -> tuple[ProtocolHandler, _FakeConnection, ParameterCache]:
+        return _make_handler(self._paired_address_file, **kwargs)
 
     @pytest.mark.asyncio
     async def test_store_offset_applied(self):
@@ -1586,6 +1967,92 @@ class TestDiscoverAddressSpace:
         assert 0 in structs
         assert 1 in structs
 
+    @pytest.mark.asyncio
+    async def test_rediscovery_reads_structs_from_bus(self):
+        """Test a second discovery of the same space fetches every batch again."""
+        handler, conn, cache = self._make_handler()
+        calls = []
+
+        async def mock_fetch(start_index, count, destination=None, with_range=True):
+            calls.append(start_index)
+            if start_index == 0:
+                return [ParamStructEntry(0, "PanelA", 0, DataType.INT16, True)], False
+            return [], True
+
+        handler.fetch_param_structs = mock_fetch
+
+        for _ in range(2):
+            structs: dict[int, ParamStructEntry] = {}
+            assert await handler._discover_address_space(
+                "panel", store_offset=10000, destination=PANEL_ADDRESS, with_range=False, structs=structs
+            )
+            assert list(structs) == [10000]
+
+        assert calls == [0, 1, 0, 1]
+
+    @pytest.mark.asyncio
+    async def test_struct_batch_size_window_resumes_after_short_reply(self):
+        """Test a large discovery window continues from the last entry actually returned."""
+        handler, conn, cache = self._make_handler()
+        handler._struct_batch_size = 255
+        requests: list[tuple[int, int]] = []
+
+        async def mock_fetch(start_index, count, destination=None, with_range=True):
+            requests.append((start_index, count))
+            if start_index >= 250:
+                return [], True
+            # Firmware caps each reply at 100 entries regardless of the window
+            stop = min(start_index + 100, 250)
+            return [ParamStructEntry(i, f"P{i}", 0, DataType.INT16, True) for i in range(start_index, stop)], False
+
+        handler.fetch_param_structs = mock_fetch
+        structs: dict[int, ParamStructEntry] = {}
+
+        assert await handler._discover_address_space(
+            "regulator", store_offset=0, destination=None, with_range=True, structs=structs
+        )
+
+        assert requests == [(0, 255), (100, 255), (200, 255), (250, 255)]
+        assert sorted(structs) == list(range(250))
+
+    def test_struct_batch_size_clamped_to_count_byte(self):
+        """Test the constructor keeps the struct window within the 1-byte count field."""
+        conn = _FakeConnection()
+        kwargs = {"token_required": False, "paired_address_file": self._paired_address_file}
+        assert ProtocolHandler(conn, ParameterCache(), **kwargs)._struct_batch_size == 100
+        assert ProtocolHandler(conn, ParameterCache(), struct_batch_size=1000, **kwargs)._struct_batch_size == 255
+        assert ProtocolHandler(conn, ParameterCache(), struct_batch_size=0, **kwargs)._struct_batch_size == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_retries_back_off(self):
+        """Test re-requests of an empty batch wait with a growing delay."""
+        handler, conn, cache = self._make_handler(discovery_retry_base=0.001)
+        call_count = 0
+
+        async def mock_fetch(start_index, count, destination=None, with_range=True):
+            nonlocal call_count
+            call_count += 1
+            if call_count <= 3:
+                return [], False
+            return [], True
+
+        handler.fetch_param_structs = mock_fetch
+        delays: list[float] = []
+        real_sleep = asyncio.sleep
+
+        async def record_sleep(delay, *args, **kwargs):
+            delays.append(delay)
+            await real_sleep(0)
+
+        with patch("econext_gateway.protocol.handler.asyncio.sleep", record_sleep):
+            result = await handler._discover_address_space(
+                "regulator", store_offset=0, destination=None, with_range=True, structs={}
+            )
+
+        assert result is True
+        assert len(delays) == 3
+        assert delays[0] < delays[1] < delays[2]
+
 
 # ============================================================================
 # Test discover_params address space integration
@@ -1599,30 +2066,14 @@ class TestDiscoverParamsAddressSpaces:
     def _paired_file(self, paired_address_file):
         self._paired_address_file = paired_address_file
 
-    def _make_handler(self) -> tuple[ProtocolHandler, MagicMock, ParameterCache]:
-        conn = MagicMock(spec=GM3SerialTransport)
-        conn.connected = True
-        conn.protocol = MagicMock(spec=GM3Protocol)
-        conn.protocol.write_frame = AsyncMock(return_value=True)
-        conn.protocol.receive_frame = AsyncMock(return_value=None)
-        conn.protocol.reset_buffer = MagicMock()
-        cache = ParameterCache()
-        handler = ProtocolHandler(
-            connection=conn,
-            cache=cache,
-            poll_interval=1.0,
-            request_timeout=0.5,
-            token_timeout=0,
-            token_required=False,
-            paired_address_file=self._paired_address_file,
-        )
-        return handler, conn, cache
+    def _make_handler(self, **kwargs) -> tuple[ProtocolHandler, _FakeConnection, ParameterCache]:
+        return _make_handler(self._paired_address_file, **kwargs)
 
     @pytest.mark.asyncio
     async def test_regulator_uses_with_range_true(self):
         """Test that regulator discovery uses with_range=True."""
         handler, conn, cache = self._make_handler()
-        handler._has_token = True
+        handler._token_event.set()
 
         captured_calls = []
 
@@ -1655,7 +2106,7 @@ class TestDiscoverParamsAddressSpaces:
     async def test_panel_uses_with_range_false_and_panel_dest(self):
         """Test that panel discovery uses with_range=False and destination=PANEL_ADDRESS."""
         handler, conn, cache = self._make_handler()
-        handler._has_token = True
+        handler._token_event.set()
 
         captured_calls = []
 
@@ -1691,7 +2142,7 @@ class TestDiscoverParamsAddressSpaces:
     async def test_panel_params_stored_at_10000_offset(self):
         """Test that panel params are stored with 10000 offset."""
         handler, conn, cache = self._make_handler()
-        handler._has_token = True
+        handler._token_event.set()
 
         async def mock_fetch(start_index, count, destination=None, with_range=True):
             if destination is None:
@@ -1768,14 +2219,29 @@ class TestDecodeAlarmDate:
         assert result is not None
         assert result.year == 2000
 
+    def test_accepts_bytearray_and_trailing_bytes(self):
+        # Cached decode is keyed on bytes; mutable/longer inputs are normalised
+        raw = struct.pack("<h", 2024) + bytes([3, 9, 8, 7, 6])
+        expected = ProtocolHandler._decode_alarm_date(raw)
+        assert ProtocolHandler._decode_alarm_date(bytearray(raw) + b"\x99") == expected
+        assert ProtocolHandler._decode_alarm_date(memoryview(raw)) == expected
+
+    def test_repeat_decode_shares_naive_datetime(self):
+        # Controller clock is local wall time: no tz is attached, and the
+        # memoised decode hands every re-read the same immutable object.
+        raw = struct.pack("<h", 2025) + bytes([10, 26, 3, 15, 0])
+        first = ProtocolHandler._decode_alarm_date(raw)
+        assert first is not None
+        assert first.tzinfo is None
+        assert ProtocolHandler._decode_alarm_date(bytes(raw)) is first
+
 
 class TestReadAlarms:
     """Tests for read_alarms method."""
 
     @pytest.fixture
     def handler(self, paired_address_file):
-        conn = MagicMock(spec=GM3SerialTransport)
-        conn.connected = True
+        conn = _FakeConnection()
         cache = ParameterCache()
         h = ProtocolHandler(
             conn,
@@ -1821,6 +2287,31 @@ class TestReadAlarms:
         assert alarms[0].to_date is None  # active
         assert alarms[1].code == 42  # 2025
 
+    @pytest.mark.asyncio
+    async def test_alarms_sorted_by_decoded_date(self, handler):
+        """Ordering follows the decoded timestamp, not the read index."""
+        null_date = b"\xff\xff\xff\xff\xff\xff\xff"
+        records = [
+            bytes([1]) + struct.pack("<h", 2025) + bytes([3, 9, 10, 0, 0]) + null_date,
+            bytes([2]) + struct.pack("<h", 2025) + bytes([11, 2, 7, 0, 0]) + null_date,
+            bytes([3]) + struct.pack("<h", 2025) + bytes([3, 9, 10, 0, 5]) + null_date,
+            bytes([0]) + null_date + null_date,
+        ]
+        call_count = 0
+
+        async def mock_send(command, data, expected_response=None, destination=None, **kwargs):
+            nonlocal call_count
+            resp_data = records[call_count]
+            call_count += 1
+            return Frame(destination=TEST_BUS_ADDRESS, command=Command.SERVICE_RESPONSE, data=resp_data)
+
+        handler.send_and_receive = mock_send
+
+        alarms = await handler.read_alarms()
+
+        assert [a.code for a in alarms] == [2, 3, 1]
+        assert list(handler.alarms) == alarms
+
     @pytest.mark.asyncio
     async def test_read_alarms_empty(self, handler):
         """First alarm is null -> empty list."""
@@ -1871,15 +2362,106 @@ class TestReadAlarms:
         assert data == ALARM_REQUEST_PREFIX + bytes([0])  # index 0
 
     @pytest.mark.asyncio
-    async def test_alarms_property_returns_copy(self, handler):
-        """alarms property returns a copy of the internal list."""
-        handler._alarms = [
-            Alarm(index=0, code=1, from_date="2025-01-01T00:00:00", to_date=None),
+    async def test_read_alarms_batched_reply(self, handler):
+        """Batched request: one reply carrying several records and the end marker."""
+        handler._alarm_batch_size = 8
+        alarm_a = bytes([5]) + struct.pack("<h", 2025) + bytes([1, 2, 3, 4, 5]) + b"\xff" * 7
+        alarm_b = bytes([6]) + struct.pack("<h", 2025) + bytes([2, 3, 4, 5, 6]) + b"\xff" * 7
+        null_record = bytes([0]) + b"\xff" * 14
+        sent = []
+
+        async def mock_send(command, data, expected_response=None, destination=None, **kwargs):
+            sent.append(data)
+            return Frame(
+                destination=TEST_BUS_ADDRESS,
+                command=Command.SERVICE_RESPONSE,
+                data=alarm_a + alarm_b + null_record,
+            )
+
+        handler.send_and_receive = mock_send
+
+        alarms = await handler.read_alarms()
+
+        assert sent == [ALARM_REQUEST_PREFIX + bytes([0, 8])]
+        assert sorted(a.index for a in alarms) == [0, 1]
+        assert {a.code for a in alarms} == {5, 6}
+        assert handler._alarm_batch_size == 8
+
+    @pytest.mark.asyncio
+    async def test_read_alarms_batch_single_record_keeps_batch(self, handler):
+        """One record in reply to a batched request is a short list, not a downgrade."""
+        handler._alarm_batch_size = 8
+        alarm = bytes([9]) + struct.pack("<h", 2025) + bytes([1, 2, 3, 4, 5]) + b"\xff" * 7
+        null_record = bytes([0]) + b"\xff" * 14
+        sent = []
+
+        async def mock_send(command, data, expected_response=None, destination=None, **kwargs):
+            sent.append(data)
+            resp = alarm if len(sent) == 1 else null_record
+            return Frame(destination=TEST_BUS_ADDRESS, command=Command.SERVICE_RESPONSE, data=resp)
+
+        handler.send_and_receive = mock_send
+
+        alarms = await handler.read_alarms()
+
+        assert len(alarms) == 1
+        assert sent == [ALARM_REQUEST_PREFIX + bytes([0, 8]), ALARM_REQUEST_PREFIX + bytes([1, 8])]
+        assert handler._alarm_batch_size == 8
+
+    @pytest.mark.asyncio
+    async def test_read_alarms_batch_falls_back_to_single(self, handler):
+        """No reply to a batched request retries the index alone and keeps single-index reads."""
+        handler._alarm_batch_size = 8
+        alarm = bytes([9]) + struct.pack("<h", 2025) + bytes([1, 2, 3, 4, 5]) + b"\xff" * 7
+        null_record = bytes([0]) + b"\xff" * 14
+        sent = []
+
+        async def mock_send(command, data, expected_response=None, destination=None, **kwargs):
+            sent.append(data)
+            if len(sent) == 1:
+                return None
+            resp = alarm if len(sent) == 2 else null_record
+            return Frame(destination=TEST_BUS_ADDRESS, command=Command.SERVICE_RESPONSE, data=resp)
+
+        handler.send_and_receive = mock_send
+
+        alarms = await handler.read_alarms()
+
+        assert [a.code for a in alarms] == [9]
+        assert sent == [
+            ALARM_REQUEST_PREFIX + bytes([0, 8]),
+            ALARM_REQUEST_PREFIX + bytes([0]),
+            ALARM_REQUEST_PREFIX + bytes([1]),
         ]
+        assert handler._alarm_batch_size == 1
+
+    @pytest.mark.asyncio
+    async def test_read_alarms_batch_short_reply_at_end_keeps_batch(self, handler):
+        """A short batched reply at the end of the list does not downgrade once the retry is empty too."""
+        handler._alarm_batch_size = 8
+        sent = []
+
+        async def mock_send(command, data, expected_response=None, destination=None, **kwargs):
+            sent.append(data)
+            return Frame(destination=TEST_BUS_ADDRESS, command=Command.SERVICE_RESPONSE, data=b"\x00")
+
+        handler.send_and_receive = mock_send
+
+        alarms = await handler.read_alarms()
+
+        assert alarms == []
+        assert sent == [ALARM_REQUEST_PREFIX + bytes([0, 8]), ALARM_REQUEST_PREFIX + bytes([0])]
+        assert handler._alarm_batch_size == 8
+
+    @pytest.mark.asyncio
+    async def test_alarms_property_returns_snapshot(self, handler):
+        """alarms property returns the immutable cached snapshot without copying."""
+        handler._alarms = (Alarm(index=0, code=1, from_date="2025-01-01T00:00:00", to_date=None),)
         result = handler.alarms
+        assert isinstance(result, tuple)
         assert len(result) == 1
-        result.clear()
-        assert len(handler._alarms) == 1  # original unchanged
+        assert result is handler._alarms
+        assert handler.alarms is result  # no per-read allocation
 
 
 class TestParseDeviceTable:
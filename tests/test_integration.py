@@ -8,15 +8,18 @@ FastAPI API all use real code.
 import asyncio
 import struct
 import tempfile
-from contextlib import asynccontextmanager
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
 
 from econext_gateway.api.dependencies import app_state
 from econext_gateway.core.cache import ParameterCache
 from econext_gateway.core.models import Parameter
+from econext_gateway.main import app
 from econext_gateway.protocol.codec import encode_value
 from econext_gateway.protocol.constants import (
     CLAIMABLE_ADDRESS_RANGE,
@@ -58,12 +61,39 @@ TEST_BUS_ADDRESS = 200
 # Helpers
 # ---------------------------------------------------------------------------
 
+_HEADER = struct.Struct("<BH")  # count, start index
+_RANGE = struct.Struct("<BBhh")  # type, extra, min, max
+_EXP_TYPE = struct.Struct("<bB")
+
+# Canned payloads shared by several tests
+_TOKEN_GRANT = struct.pack("<H", GET_TOKEN_FUNC) + b"\x00\x00"
+_PAIRING_BEACON = struct.pack("<H", PAIRING_BEACON_FUNC) + b"\x00\x00"
+_DEVICE_TABLE_HEADER = struct.pack("<H", DEVICE_TABLE_FUNC) + b"\x00\x00"
+_MODIFY_ACK_65 = bytes.fromhex("00004100")  # controller ack for a write of 65
+
+# Writes replace cached parameters via model_copy, so one instance can be shared
+_SETPOINT = Parameter(
+    index=0,
+    name="SetPoint",
+    value=50,
+    type=DataType.INT16,
+    unit=1,
+    writable=True,
+    min_value=20.0,
+    max_value=80.0,
+)
+
 
 def make_frame(source: int, dest: int, command: int, data: bytes = b"") -> bytes:
     """Build raw frame bytes with an arbitrary source address."""
-    frame = Frame(destination=dest, command=command, data=data)
-    frame.source = source
-    return frame.to_bytes()
+    return Frame(destination=dest, command=command, data=data, source=source).to_bytes()
+
+
+def _put_cstr(buf: bytearray, offset: int, raw: bytes) -> int:
+    """Write raw into a zero-filled buffer; return the offset past its NUL."""
+    end = offset + len(raw)
+    buf[offset:end] = raw
+    return end + 1
 
 
 def build_struct_with_range(start_index: int, params: list[tuple]) -> bytes:
@@ -71,28 +101,24 @@ def build_struct_with_range(start_index: int, params: list[tuple]) -> bytes:
 
     params: list of (name, unit_str, type_code, writable, min_val|None, max_val|None)
     """
-    data = bytearray()
-    data.append(len(params))
-    data.extend(struct.pack("<H", start_index))
-
-    for name, unit_str, type_code, writable, min_val, max_val in params:
-        data.extend(name.encode() + b"\x00")
-        data.extend(unit_str.encode() + b"\x00")
-
-        type_byte = type_code
-        if writable:
-            type_byte |= 0x20
-        data.append(type_byte)
-
-        extra_byte = 0x00
-        if min_val is None:
-            extra_byte |= 0x40
-        if max_val is None:
-            extra_byte |= 0x80
-        data.append(extra_byte)
-
-        data.extend(struct.pack("<h", int(min_val) if min_val is not None else 0))
-        data.extend(struct.pack("<h", int(max_val) if max_val is not None else 0))
+    strings = [(p[0].encode(), p[1].encode()) for p in params]
+    data = bytearray(_HEADER.size + sum(len(n) + len(u) + 2 + _RANGE.size for n, u in strings))
+    _HEADER.pack_into(data, 0, len(params), start_index)
+    offset = _HEADER.size
+
+    for (name, unit), (_, _, type_code, writable, min_val, max_val) in zip(strings, params, strict=True):
+        offset = _put_cstr(data, offset, name)
+        offset = _put_cstr(data, offset, unit)
+
+        _RANGE.pack_into(
+            data,
+            offset,
+            type_code | bool(writable) << 5,  # 0x20 = writable
+            (min_val is None) << 6 | (max_val is None) << 7,  # 0x40/0x80 = no min/max
+            int(min_val) if min_val is not None else 0,
+            int(max_val) if max_val is not None else 0,
+        )
+        offset += _RANGE.size
 
     return bytes(data)
 
@@ -102,18 +128,17 @@ def build_struct_no_range(start_index: int, params: list[tuple]) -> bytes:
 
     params: list of (name, unit_str, type_code, writable)
     """
-    data = bytearray()
-    data.append(len(params))
-    data.extend(struct.pack("<H", start_index))
+    strings = [(p[0].encode(), p[1].encode()) for p in params]
+    data = bytearray(_HEADER.size + sum(len(n) + len(u) + 2 + _EXP_TYPE.size for n, u in strings))
+    _HEADER.pack_into(data, 0, len(params), start_index)
+    offset = _HEADER.size
 
-    for name, unit_str, type_code, writable in params:
-        data.extend(name.encode() + b"\x00")
-        data.extend(unit_str.encode() + b"\x00")
+    for (name, unit), (_, _, type_code, writable) in zip(strings, params, strict=True):
+        offset = _put_cstr(data, offset, name)
+        offset = _put_cstr(data, offset, unit)
 
-        type_byte = type_code
-        if writable:
-            type_byte |= 0x20
-        data.extend(struct.pack("<bB", 0, type_byte))  # exponent=0, type
+        _EXP_TYPE.pack_into(data, offset, 0, type_code | bool(writable) << 5)  # exponent=0, type
+        offset += _EXP_TYPE.size
 
     return bytes(data)
 
@@ -123,14 +148,13 @@ def build_params_response(start_index: int, values: list[tuple]) -> bytes:
 
     values: list of (value, type_code)
     """
-    data = bytearray()
-    data.append(len(values))
-    data.extend(struct.pack("<H", start_index))
-    data.append(0x00)  # separator
+    encoded = [encode_value(value, type_code) for value, type_code in values]
+    data = bytearray(_HEADER.size + 1 + sum(len(e) + 1 for e in encoded))
+    _HEADER.pack_into(data, 0, len(values), start_index)
+    offset = _HEADER.size + 1  # separator
 
-    for value, type_code in values:
-        data.extend(encode_value(value, type_code))
-        data.append(0x00)  # separator
+    for raw in encoded:
+        offset = _put_cstr(data, offset, raw)  # value + separator
 
     return bytes(data)
 
@@ -144,12 +168,14 @@ class FakeProtocol:
     """Mock GM3Protocol that operates at the Frame level.
 
     Frames are returned from receive_frame() in FIFO order. When the queue
-    is exhausted, receive_frame() returns None (timeout).
+    is exhausted, receive_frame() returns None (timeout). Queued frames are
+    handed out without touching the event loop; only an empty queue waits.
     """
 
     def __init__(self):
         self._connected = True
-        self._frame_queue: asyncio.Queue[Frame | None] = asyncio.Queue()
+        self._frame_queue: deque[Frame] = deque()
+        self._frame_queued = asyncio.Event()
         self._writes: list[Frame] = []
 
     @property
@@ -157,10 +183,16 @@ class FakeProtocol:
         return self._connected
 
     async def receive_frame(self, timeout: float | None = None) -> Frame | None:
-        try:
-            return await asyncio.wait_for(self._frame_queue.get(), timeout=timeout or 0.05)
-        except TimeoutError:
-            return None
+        if not self._frame_queue:
+            self._frame_queued.clear()
+            try:
+                await asyncio.wait_for(self._frame_queued.wait(), timeout=timeout or 0.05)
+            except TimeoutError:
+                return None
+        return self._frame_queue.popleft()
+
+    def try_receive_frame_nowait(self) -> Frame | None:
+        return self._frame_queue.popleft() if self._frame_queue else None
 
     async def write_frame(self, frame: Frame, flush_after: bool = False, clear_echo: bool = True) -> bool:
         self._writes.append(frame)
@@ -173,9 +205,19 @@ class FakeProtocol:
 
     def queue_frame(self, source: int, command: int, data: bytes = b"") -> None:
         """Queue a response frame addressed to the test bus address."""
-        frame = Frame(destination=TEST_BUS_ADDRESS, command=command, data=data)
-        frame.source = source
-        self._frame_queue.put_nowait(frame)
+        self.queue_frames([(source, command, data)])
+
+    def queue_frames(self, specs: list[tuple]) -> None:
+        """Queue several (source, command[, data]) frames with one wakeup."""
+        for source, command, *data in specs:
+            frame = Frame(destination=TEST_BUS_ADDRESS, command=command, data=data[0] if data else b"", source=source)
+            self._frame_queue.append(frame)
+        self._frame_queued.set()
+
+    def push_frame(self, frame: Frame) -> None:
+        """Queue a prebuilt frame as-is."""
+        self._frame_queue.append(frame)
+        self._frame_queued.set()
 
 
 class FakeTransport:
@@ -213,6 +255,26 @@ def cache():
     return ParameterCache()
 
 
+@contextmanager
+def _patched_state(conn, cache, handler):
+    """Install conn/cache/handler in app_state for the block, then restore."""
+    state = app_state
+    orig = state.connection, state.cache, state.handler
+    state.connection, state.cache, state.handler = conn, cache, handler
+    try:
+        yield
+    finally:
+        state.connection, state.cache, state.handler = orig
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client():
+    """HTTP client that calls the app in-process on the test event loop."""
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
 def _make_paired_file(address: int = TEST_BUS_ADDRESS) -> Path:
     """Create a temporary paired address file for tests."""
     d = Path(tempfile.mkdtemp())
@@ -223,12 +285,9 @@ def _make_paired_file(address: int = TEST_BUS_ADDRESS) -> Path:
 
 def _make_device_table_frame(*addresses: int) -> Frame:
     """Build a SERVICE 0x2001 device table broadcast frame from the panel."""
-    data = struct.pack("<H", DEVICE_TABLE_FUNC) + b"\x00\x00"
-    for addr in addresses:
-        data += struct.pack("<Hf", addr, 20.0)  # address + dummy temperature
-    frame = Frame(destination=0xFFFF, command=Command.SERVICE, data=data)
-    frame.source = PANEL_ADDRESS
-    return frame
+    # address + dummy temperature per device
+    data = _DEVICE_TABLE_HEADER + b"".join(struct.pack("<Hf", addr, 20.0) for addr in addresses)
+    return Frame(destination=0xFFFF, command=Command.SERVICE, data=data, source=PANEL_ADDRESS)
 
 
 def _make_empty_paired_file() -> Path:
@@ -274,10 +333,14 @@ class TestDiscoveryIntegration:
                 ("Pressure", "%", DataType.UINT8, False, None, None),
             ],
         )
-        fake_proto.queue_frame(1, Command.GET_PARAMS_STRUCT_WITH_RANGE_RESPONSE, struct_data)
-        fake_proto.queue_frame(1, Command.NO_DATA)
-        # Panel: no params
-        fake_proto.queue_frame(PANEL_ADDRESS, Command.NO_DATA)
+        fake_proto.queue_frames(
+            [
+                (1, Command.GET_PARAMS_STRUCT_WITH_RANGE_RESPONSE, struct_data),
+                (1, Command.NO_DATA),
+                # Panel: no params
+                (PANEL_ADDRESS, Command.NO_DATA),
+            ]
+        )
 
         async with dispatcher_running(handler):
             total = await handler.discover_params()
@@ -303,8 +366,6 @@ class TestDiscoveryIntegration:
                 ("RegBool", "", DataType.BOOL, False, None, None),
             ],
         )
-        fake_proto.queue_frame(1, Command.GET_PARAMS_STRUCT_WITH_RANGE_RESPONSE, reg_data)
-        fake_proto.queue_frame(1, Command.NO_DATA)
 
         # Panel: 1 param
         panel_data = build_struct_no_range(
@@ -313,8 +374,14 @@ class TestDiscoveryIntegration:
                 ("PanelTemp", "C", DataType.INT16, True),
             ],
         )
-        fake_proto.queue_frame(PANEL_ADDRESS, Command.GET_PARAMS_STRUCT_RESPONSE, panel_data)
-        fake_proto.queue_frame(PANEL_ADDRESS, Command.NO_DATA)
+        fake_proto.queue_frames(
+            [
+                (1, Command.GET_PARAMS_STRUCT_WITH_RANGE_RESPONSE, reg_data),
+                (1, Command.NO_DATA),
+                (PANEL_ADDRESS, Command.GET_PARAMS_STRUCT_RESPONSE, panel_data),
+                (PANEL_ADDRESS, Command.NO_DATA),
+            ]
+        )
 
         async with dispatcher_running(handler):
             total = await handler.discover_params()
@@ -338,8 +405,7 @@ class TestDiscoveryIntegration:
         }
 
         # Both address spaces return NO_DATA immediately
-        fake_proto.queue_frame(1, Command.NO_DATA)
-        fake_proto.queue_frame(PANEL_ADDRESS, Command.NO_DATA)
+        fake_proto.queue_frames([(1, Command.NO_DATA), (PANEL_ADDRESS, Command.NO_DATA)])
 
         async with dispatcher_running(handler):
             total = await handler.discover_params()
@@ -397,34 +463,49 @@ class TestPollIntegration:
 class TestWriteIntegration:
     """Write flow: MODIFY_PARAM -> response -> cache update."""
 
-    @pytest.mark.asyncio
-    async def test_write_param_success(self, fake_conn, fake_proto, cache):
-        """Successful write returns True and updates cache."""
-        handler = make_handler(fake_conn, cache)
+    @pytest_asyncio.fixture
+    async def setpoint_handler(self, fake_conn, cache):
+        """Handler with a writable SetPoint (20..80) cached at 50."""
+        handler = make_handler(fake_conn, cache, response_timeout=0.05)
         handler._param_structs = {
             0: ParamStructEntry(0, "SetPoint", 1, DataType.INT16, True, 20.0, 80.0),
         }
-        await cache.set(
-            Parameter(
-                index=0,
-                name="SetPoint",
-                value=50,
-                type=DataType.INT16,
-                unit=1,
-                writable=True,
-                min_value=20.0,
-                max_value=80.0,
-            )
-        )
+        await cache.set(_SETPOINT)
+        return handler
 
-        fake_proto.queue_frame(1, Command.MODIFY_PARAM_RESPONSE, b"\x00\x00\x41\x00")
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "response,expected,cached",
+        [
+            # Acknowledged write returns True and updates cache
+            (_MODIFY_ACK_65, True, 65),
+            # No response -> send_and_receive times out, cache untouched
+            (None, False, 50),
+        ],
+        ids=["success", "no_ack_returns_false"],
+    )
+    async def test_write_setpoint(self, setpoint_handler, fake_proto, cache, response, expected, cached):
+        """Write outcomes for an in-range value on a writable ranged parameter."""
+        handler = setpoint_handler
+        if response is not None:
+            fake_proto.queue_frame(1, Command.MODIFY_PARAM_RESPONSE, response)
 
         async with dispatcher_running(handler):
-            result = await handler.write_param("SetPoint", 65)
+            assert await handler.write_param("SetPoint", 65) is expected
 
-        assert result is True
-        updated = await cache.get(0)
-        assert updated.value == 65
+        param = await cache.get(0)
+        assert param.value == cached
+
+    @pytest.mark.asyncio
+    async def test_write_setpoint_out_of_range_raises(self, setpoint_handler, fake_proto, cache):
+        """A value above max raises before anything is sent; cache untouched."""
+        async with dispatcher_running(setpoint_handler):
+            with pytest.raises(ValueError, match="above maximum"):
+                await setpoint_handler.write_param("SetPoint", 100)
+
+        assert not any(w.command == Command.MODIFY_PARAM for w in fake_proto._writes)
+        param = await cache.get(0)
+        assert param.value == 50
 
     @pytest.mark.asyncio
     async def test_write_read_only_raises(self, fake_conn, fake_proto, cache):
@@ -447,57 +528,6 @@ class TestWriteIntegration:
         with pytest.raises(ValueError, match="read-only"):
             await handler.write_param("ReadOnly", 99)
 
-    @pytest.mark.asyncio
-    async def test_write_out_of_range_raises(self, fake_conn, fake_proto, cache):
-        """Writing a value outside min/max raises ValueError."""
-        handler = make_handler(fake_conn, cache)
-        handler._param_structs = {
-            0: ParamStructEntry(0, "SetPoint", 1, DataType.INT16, True, 20.0, 80.0),
-        }
-        await cache.set(
-            Parameter(
-                index=0,
-                name="SetPoint",
-                value=50,
-                type=DataType.INT16,
-                unit=1,
-                writable=True,
-                min_value=20.0,
-                max_value=80.0,
-            )
-        )
-
-        with pytest.raises(ValueError, match="above maximum"):
-            await handler.write_param("SetPoint", 100)
-
-    @pytest.mark.asyncio
-    async def test_write_no_ack_returns_false(self, fake_conn, fake_proto, cache):
-        """Write that gets no response returns False."""
-        handler = make_handler(fake_conn, cache)
-        handler._param_structs = {
-            0: ParamStructEntry(0, "SetPoint", 1, DataType.INT16, True, 20.0, 80.0),
-        }
-        await cache.set(
-            Parameter(
-                index=0,
-                name="SetPoint",
-                value=50,
-                type=DataType.INT16,
-                unit=1,
-                writable=True,
-                min_value=20.0,
-                max_value=80.0,
-            )
-        )
-
-        # No response queued -> send_and_receive times out
-        result = await handler.write_param("SetPoint", 65)
-
-        assert result is False
-        # Cache should NOT be updated
-        param = await cache.get(0)
-        assert param.value == 50
-
 
 # ---------------------------------------------------------------------------
 # Token grant integration
@@ -512,14 +542,17 @@ class TestTokenIntegration:
         """Handler responds to IDENTIFY, receives token, discovers, returns token."""
         handler = make_handler(fake_conn, cache, token_required=True)
 
-        # Panel probes us
-        fake_proto.queue_frame(PANEL_ADDRESS, Command.IDENTIFY)
-        # Panel grants token
-        token_data = struct.pack("<H", GET_TOKEN_FUNC) + b"\x00\x00"
-        fake_proto.queue_frame(PANEL_ADDRESS, Command.SERVICE, token_data)
-        # Empty discovery (both spaces)
-        fake_proto.queue_frame(1, Command.NO_DATA)
-        fake_proto.queue_frame(PANEL_ADDRESS, Command.NO_DATA)
+        fake_proto.queue_frames(
+            [
+                # Panel probes us
+                (PANEL_ADDRESS, Command.IDENTIFY),
+                # Panel grants token
+                (PANEL_ADDRESS, Command.SERVICE, _TOKEN_GRANT),
+                # Empty discovery (both spaces)
+                (1, Command.NO_DATA),
+                (PANEL_ADDRESS, Command.NO_DATA),
+            ]
+        )
 
         async with dispatcher_running(handler):
             await handler.discover_params()
@@ -538,132 +571,95 @@ class TestTokenIntegration:
 class TestApiIntegration:
     """FastAPI endpoints backed by real handler and cache.
 
-    The TestClient runs the lifespan (which creates its own objects),
-    so we overwrite app_state AFTER the client starts and restore
-    BEFORE it exits so the teardown works on the original objects.
+    The ASGI client does not run the lifespan, so each test installs
+    its own connection, cache and handler in app_state and restores the
+    previous objects afterwards.
     """
 
-    @staticmethod
-    def _swap(conn, cache, handler):
-        """Overwrite app_state; return originals for restore."""
-        orig = (app_state.connection, app_state.cache, app_state.handler)
-        app_state.connection = conn
-        app_state.cache = cache
-        app_state.handler = handler
-        return orig
-
-    @staticmethod
-    def _restore(orig):
-        app_state.connection, app_state.cache, app_state.handler = orig
-
-    def test_get_parameters_returns_cached_data(self, fake_conn, cache):
+    @pytest.mark.asyncio
+    async def test_get_parameters_returns_cached_data(self, async_client, fake_conn, cache):
         """GET /api/parameters returns params stored in cache by handler."""
-        from econext_gateway.main import app
-
         handler = make_handler(fake_conn, cache)
         handler._param_structs = {
             0: ParamStructEntry(0, "Temperature", 1, DataType.INT16, True, 20.0, 80.0),
         }
-        asyncio.run(
-            cache.set(
-                Parameter(
-                    index=0,
-                    name="Temperature",
-                    value=42,
-                    type=DataType.INT16,
-                    unit=1,
-                    writable=True,
-                    min_value=20.0,
-                    max_value=80.0,
-                )
+        await cache.set(
+            Parameter(
+                index=0,
+                name="Temperature",
+                value=42,
+                type=DataType.INT16,
+                unit=1,
+                writable=True,
+                min_value=20.0,
+                max_value=80.0,
             )
         )
 
-        with TestClient(app, raise_server_exceptions=False) as client:
-            orig = self._swap(fake_conn, cache, handler)
-            try:
-                response = client.get("/api/parameters")
-
-                assert response.status_code == 200
-                data = response.json()
-                assert "0" in data["parameters"]
-                temp = data["parameters"]["0"]
-                assert temp["name"] == "Temperature"
-                assert temp["value"] == 42
-                assert temp["min"] == 20.0
-                assert temp["max"] == 80.0
-                assert temp["writable"] is True
-            finally:
-                self._restore(orig)
-
-    def test_health_reflects_connection_state(self):
-        """Health endpoint reflects handler connected / cache count."""
-        from econext_gateway.main import app
+        with _patched_state(fake_conn, cache, handler):
+            response = await async_client.get("/api/parameters")
+
+            assert response.status_code == 200
+            data = response.json()
+            assert "0" in data["parameters"]
+            temp = data["parameters"]["0"]
+            assert temp["name"] == "Temperature"
+            assert temp["value"] == 42
+            assert temp["min"] == 20.0
+            assert temp["max"] == 80.0
+            assert temp["writable"] is True
 
+    @pytest.mark.asyncio
+    async def test_health_reflects_connection_state(self, async_client):
+        """Health endpoint reflects handler connected / cache count."""
         conn = FakeTransport()
         c = ParameterCache()
         handler = make_handler(conn, c)
 
-        with TestClient(app, raise_server_exceptions=False) as client:
-            orig = self._swap(conn, c, handler)
-            try:
-                # Connected, no params -> degraded
-                resp = client.get("/health")
-                assert resp.json()["status"] == "degraded"
-                assert resp.json()["controller_connected"] is True
-
-                # Add a param -> healthy
-                asyncio.run(
-                    c.set(
-                        Parameter(
-                            index=0,
-                            name="T",
-                            value=1,
-                            type=2,
-                            unit=0,
-                            writable=False,
-                        )
-                    )
+        with _patched_state(conn, c, handler):
+            # Connected, no params -> degraded
+            resp = await async_client.get("/health")
+            assert resp.json()["status"] == "degraded"
+            assert resp.json()["controller_connected"] is True
+
+            # Add a param -> healthy
+            await c.set(
+                Parameter(
+                    index=0,
+                    name="T",
+                    value=1,
+                    type=2,
+                    unit=0,
+                    writable=False,
                 )
-                resp = client.get("/health")
-                assert resp.json()["status"] == "healthy"
-
-                # Disconnect -> unhealthy
-                conn._protocol._connected = False
-                resp = client.get("/health")
-                assert resp.json()["status"] == "unhealthy"
-                assert resp.json()["controller_connected"] is False
-            finally:
-                self._restore(orig)
-
-    def test_post_parameter_not_found(self, fake_conn, cache):
-        """POST to nonexistent parameter returns 404."""
-        from econext_gateway.main import app
+            )
+            resp = await async_client.get("/health")
+            assert resp.json()["status"] == "healthy"
 
+            # Disconnect -> unhealthy
+            conn._protocol._connected = False
+            resp = await async_client.get("/health")
+            assert resp.json()["status"] == "unhealthy"
+            assert resp.json()["controller_connected"] is False
+
+    @pytest.mark.asyncio
+    async def test_post_parameter_not_found(self, async_client, fake_conn, cache):
+        """POST to nonexistent parameter returns 404."""
         handler = make_handler(fake_conn, cache)
 
-        with TestClient(app, raise_server_exceptions=False) as client:
-            orig = self._swap(fake_conn, cache, handler)
-            try:
-                resp = client.post("/api/parameters/NoSuch", json={"value": 42})
-                assert resp.status_code == 404
-            finally:
-                self._restore(orig)
+        with _patched_state(fake_conn, cache, handler):
+            resp = await async_client.post("/api/parameters/NoSuch", json={"value": 42})
+            assert resp.status_code == 404
 
-    def test_get_parameters_disconnected_503(self, fake_conn, fake_proto, cache):
+    @pytest.mark.asyncio
+    async def test_get_parameters_disconnected_503(self, async_client, fake_conn, fake_proto, cache):
         """GET /api/parameters returns 503 when controller is disconnected."""
-        from econext_gateway.main import app
-
         fake_proto._connected = False
         handler = make_handler(fake_conn, cache)
 
-        with TestClient(app, raise_server_exceptions=False) as client:
-            orig = self._swap(fake_conn, cache, handler)
-            try:
-                resp = client.get("/api/parameters")
-                assert resp.status_code == 503
-            finally:
-                self._restore(orig)
+        with _patched_state(fake_conn, cache, handler):
+            resp = await async_client.get("/api/parameters")
+            assert resp.status_code == 503
 
 
 # ---------------------------------------------------------------------------
@@ -689,18 +685,15 @@ class TestRegistrationStateMachine:
         assert handler._source_address == 0
 
         # Panel broadcasts device table (must arrive before IDENTIFY)
-        fake_proto._frame_queue.put_nowait(_make_device_table_frame(100, 166))
+        fake_proto.push_frame(_make_device_table_frame(100, 166))
 
         # Panel scans address 112 (in claimable range)
-        identify_frame = Frame(destination=112, command=Command.IDENTIFY, data=b"")
-        identify_frame.source = PANEL_ADDRESS
-        fake_proto._frame_queue.put_nowait(identify_frame)
+        identify_frame = Frame(destination=112, command=Command.IDENTIFY, data=b"", source=PANEL_ADDRESS)
+        fake_proto.push_frame(identify_frame)
 
         # Panel grants token to address 112
-        token_data = struct.pack("<H", GET_TOKEN_FUNC) + b"\x00\x00"
-        token_frame = Frame(destination=112, command=Command.SERVICE, data=token_data)
-        token_frame.source = PANEL_ADDRESS
-        fake_proto._frame_queue.put_nowait(token_frame)
+        token_frame = Frame(destination=112, command=Command.SERVICE, data=_TOKEN_GRANT, source=PANEL_ADDRESS)
+        fake_proto.push_frame(token_frame)
 
         async with dispatcher_running(handler):
             await handler._wait_for_token()
@@ -727,12 +720,11 @@ class TestRegistrationStateMachine:
         assert handler._registration_state == "unpaired"
 
         # Panel broadcasts device table
-        fake_proto._frame_queue.put_nowait(_make_device_table_frame(100, 166))
+        fake_proto.push_frame(_make_device_table_frame(100, 166))
 
         # Panel scans address 119 (in claimable range) -- gateway claims tentatively
-        identify_frame = Frame(destination=119, command=Command.IDENTIFY, data=b"")
-        identify_frame.source = PANEL_ADDRESS
-        fake_proto._frame_queue.put_nowait(identify_frame)
+        identify_frame = Frame(destination=119, command=Command.IDENTIFY, data=b"", source=PANEL_ADDRESS)
+        fake_proto.push_frame(identify_frame)
 
         # First, let the handler process the IDENTIFY
         # We need token_required=False and short timeout so _wait_for_token exits
@@ -758,9 +750,8 @@ class TestRegistrationStateMachine:
         )
 
         # Panel scans address 100 (reserved panel address)
-        identify_frame = Frame(destination=100, command=Command.IDENTIFY, data=b"")
-        identify_frame.source = PANEL_ADDRESS
-        fake_proto._frame_queue.put_nowait(identify_frame)
+        identify_frame = Frame(destination=100, command=Command.IDENTIFY, data=b"", source=PANEL_ADDRESS)
+        fake_proto.push_frame(identify_frame)
 
         await handler._wait_for_token()
 
@@ -793,9 +784,8 @@ class TestRegistrationStateMachine:
             paired_address_file=paired_file,
         )
 
-        identify_frame = Frame(destination=32, command=Command.IDENTIFY, data=b"")
-        identify_frame.source = PANEL_ADDRESS
-        fake_proto._frame_queue.put_nowait(identify_frame)
+        identify_frame = Frame(destination=32, command=Command.IDENTIFY, data=b"", source=PANEL_ADDRESS)
+        fake_proto.push_frame(identify_frame)
 
         await handler._wait_for_token()
 
@@ -817,9 +807,8 @@ class TestRegistrationStateMachine:
             paired_address_file=paired_file,
         )
 
-        identify_frame = Frame(destination=193, command=Command.IDENTIFY, data=b"")
-        identify_frame.source = PANEL_ADDRESS
-        fake_proto._frame_queue.put_nowait(identify_frame)
+        identify_frame = Frame(destination=193, command=Command.IDENTIFY, data=b"", source=PANEL_ADDRESS)
+        fake_proto.push_frame(identify_frame)
 
         await handler._wait_for_token()
 
@@ -835,10 +824,7 @@ class TestRegistrationStateMachine:
 
 def _make_pairing_beacon_frame() -> Frame:
     """Build a SERVICE 0x2004 pairing beacon broadcast from the panel."""
-    data = struct.pack("<H", PAIRING_BEACON_FUNC) + b"\x00\x00"
-    frame = Frame(destination=0xFFFF, command=Command.SERVICE, data=data)
-    frame.source = PANEL_ADDRESS
-    return frame
+    return Frame(destination=0xFFFF, command=Command.SERVICE, data=_PAIRING_BEACON, source=PANEL_ADDRESS)
 
 
 def _make_empty_thermostat_file() -> Path:
@@ -882,7 +868,7 @@ class TestThermostatRegistration:
         assert handler._thermostat_reg_state == "pairing_requested"
 
         # Pairing beacon triggers SERVICE_ANS response
-        fake_proto._frame_queue.put_nowait(_make_pairing_beacon_frame())
+        fake_proto.push_frame(_make_pairing_beacon_frame())
 
         async with dispatcher_running(handler):
             await handler._wait_for_token()
@@ -912,13 +898,12 @@ class TestThermostatRegistration:
 
         # 1. Request pairing via API, then beacon
         handler.request_thermostat_pairing()
-        fake_proto._frame_queue.put_nowait(_make_pairing_beacon_frame())
+        fake_proto.push_frame(_make_pairing_beacon_frame())
 
         # 2. Panel assigns address 165 via SERVICE 0x2005
         assign_data = struct.pack("<H", PAIRING_ASSIGN_FUNC) + b"\x00\x00" + struct.pack("<H", 165)
-        assign_frame = Frame(destination=0xFFFF, command=Command.SERVICE, data=assign_data)
-        assign_frame.source = PANEL_ADDRESS
-        fake_proto._frame_queue.put_nowait(assign_frame)
+        assign_frame = Frame(destination=0xFFFF, command=Command.SERVICE, data=assign_data, source=PANEL_ADDRESS)
+        fake_proto.push_frame(assign_frame)
 
         async with dispatcher_running(handler):
             await handler._wait_for_token()
@@ -954,7 +939,7 @@ class TestThermostatRegistration:
         # Request pairing, then multiple beacons (like real panel sends ~10/sec)
         handler.request_thermostat_pairing()
         for _ in range(5):
-            fake_proto._frame_queue.put_nowait(_make_pairing_beacon_frame())
+            fake_proto.push_frame(_make_pairing_beacon_frame())
 
         async with dispatcher_running(handler):
             await handler._wait_for_token()
@@ -975,7 +960,7 @@ class TestThermostatRegistration:
             # No thermostat emulator
         )
 
-        fake_proto._frame_queue.put_nowait(_make_pairing_beacon_frame())
+        fake_proto.push_frame(_make_pairing_beacon_frame())
         await handler._wait_for_token()
 
         service_ans = [w for w in fake_proto._writes if w.command == Command.SERVICE_RESPONSE]
@@ -999,7 +984,7 @@ class TestThermostatRegistration:
 
         assert handler._thermostat_reg_state == "paired"
 
-        fake_proto._frame_queue.put_nowait(_make_pairing_beacon_frame())
+        fake_proto.push_frame(_make_pairing_beacon_frame())
         await handler._wait_for_token()
 
         service_ans = [w for w in fake_proto._writes if w.command == Command.SERVICE_RESPONSE]
@@ -1022,7 +1007,7 @@ class TestThermostatRegistration:
         )
 
         # Pairing beacon present but NO API request -- should be ignored
-        fake_proto._frame_queue.put_nowait(_make_pairing_beacon_frame())
+        fake_proto.push_frame(_make_pairing_beacon_frame())
 
         await handler._wait_for_token()
 
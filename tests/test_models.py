@@ -15,6 +15,9 @@ from econext_gateway.core.models import (
     ParametersResponse,
 )
 
+# Fixed timestamp for tests that don't care about the clock
+_T0 = datetime(2026, 1, 13, 10, 30, 0)
+
 
 class TestParameter:
     """Tests for Parameter model."""
@@ -57,41 +60,17 @@ class TestParameter:
         assert param.min_value is None
         assert param.max_value is None
 
-    def test_parameter_negative_index(self):
-        """Test parameter with negative index fails validation."""
+    @pytest.mark.parametrize(
+        "field,bad",
+        [("index", -1), ("name", ""), ("name", "   ")],
+        ids=["negative_index", "empty_name", "whitespace_name"],
+    )
+    def test_parameter_invalid_field(self, field, bad):
+        """Test negative index and empty or whitespace-only names fail validation."""
+        kwargs = {"index": 0, "name": "Test", "value": 0, "type": 1, "unit": 0, "writable": False}
+        kwargs[field] = bad
         with pytest.raises(ValidationError):
-            Parameter(
-                index=-1,
-                name="Test",
-                value=0,
-                type=1,
-                unit=0,
-                writable=False,
-            )
-
-    def test_parameter_empty_name(self):
-        """Test parameter with empty name fails validation."""
-        with pytest.raises(ValidationError):
-            Parameter(
-                index=0,
-                name="",
-                value=0,
-                type=1,
-                unit=0,
-                writable=False,
-            )
-
-    def test_parameter_whitespace_name(self):
-        """Test parameter with whitespace-only name fails validation."""
-        with pytest.raises(ValidationError):
-            Parameter(
-                index=0,
-                name="   ",
-                value=0,
-                type=1,
-                unit=0,
-                writable=False,
-            )
+            Parameter(**kwargs)
 
     def test_parameter_invalid_range_cleared(self):
         """Test parameter with max < min clears the range."""
@@ -108,23 +87,27 @@ class TestParameter:
         assert param.min_value is None
         assert param.max_value is None
 
-    def test_parameter_different_value_types(self):
+    @pytest.mark.parametrize(
+        "value,type_code",
+        [(42, 2), (22.5, 7), (True, 10), ("test", 12)],
+        ids=["int", "float", "bool", "string"],
+    )
+    def test_parameter_different_value_types(self, value, type_code):
         """Test parameter accepts different value types."""
-        # Integer
-        param_int = Parameter(index=0, name="Int", value=42, type=2, unit=0, writable=False)
-        assert param_int.value == 42
+        param = Parameter(index=0, name="P", value=value, type=type_code, unit=0, writable=False)
+        assert param.value == value
+        assert type(param.value) is type(value)
 
-        # Float
-        param_float = Parameter(index=1, name="Float", value=22.5, type=7, unit=1, writable=False)
-        assert param_float.value == 22.5
 
-        # Boolean
-        param_bool = Parameter(index=2, name="Bool", value=True, type=10, unit=0, writable=False)
-        assert param_bool.value is True
+_SEED_COLLECTION = ParameterCollection(
+    parameters={"Test": Parameter(index=0, name="Test", value=10, type=1, unit=0, writable=False)}
+)
 
-        # String
-        param_str = Parameter(index=3, name="String", value="test", type=12, unit=0, writable=False)
-        assert param_str.value == "test"
+
+@pytest.fixture
+def seeded() -> ParameterCollection:
+    """Fresh collection holding one parameter "Test" with value 10."""
+    return _SEED_COLLECTION.model_copy(deep=True)
 
 
 class TestParameterCollection:
@@ -148,12 +131,9 @@ class TestParameterCollection:
         assert "Param1" in collection.parameters
         assert "Param2" in collection.parameters
 
-    def test_collection_get_parameter(self):
+    def test_collection_get_parameter(self, seeded):
         """Test getting parameter from collection."""
-        param = Parameter(index=0, name="Test", value=10, type=1, unit=0, writable=False)
-        collection = ParameterCollection(parameters={"Test": param})
-
-        result = collection.get_parameter("Test")
+        result = seeded.get_parameter("Test")
         assert result is not None
         assert result.name == "Test"
         assert result.value == 10
@@ -175,27 +155,26 @@ class TestParameterCollection:
         assert "New" in collection.parameters
         assert collection.parameters["New"].value == 42
 
-    def test_collection_update_parameter(self):
+    def test_collection_update_parameter(self, seeded):
         """Test updating existing parameter in collection."""
-        param1 = Parameter(index=0, name="Test", value=10, type=1, unit=0, writable=True)
-        collection = ParameterCollection(parameters={"Test": param1})
+        param1 = seeded.parameters["Test"]
 
-        param2 = Parameter(index=0, name="Test", value=20, type=1, unit=0, writable=True)
-        collection.set_parameter(param2)
+        # Same shape as a handler write: copy the cached model with a new value
+        param2 = param1.model_copy(update={"value": 20})
+        seeded.set_parameter(param2)
 
-        assert len(collection.parameters) == 1
-        assert collection.parameters["Test"].value == 20
+        assert len(seeded.parameters) == 1
+        assert seeded.parameters["Test"].value == 20
+        assert param1.value == 10
 
-    def test_collection_remove_parameter(self):
+    def test_collection_remove_parameter(self, seeded):
         """Test removing parameter from collection."""
-        param = Parameter(index=0, name="Test", value=10, type=1, unit=0, writable=False)
-        collection = ParameterCollection(parameters={"Test": param})
-
-        result = collection.remove_parameter("Test")
+        result = seeded.remove_parameter("Test")
 
         assert result is True
-        assert len(collection.parameters) == 0
-        assert "Test" not in collection.parameters
+        assert len(seeded.parameters) == 0
+        assert "Test" not in seeded.parameters
+        assert "Test" in _SEED_COLLECTION.parameters
 
     def test_collection_remove_nonexistent(self):
         """Test removing nonexistent parameter returns False."""
@@ -209,7 +188,6 @@ class TestParametersResponse:
 
     def test_parameters_response_valid(self):
         """Test creating valid parameters response."""
-        timestamp = datetime(2026, 1, 13, 10, 30, 0)
         params = {
             "HDWTSetPoint": {
                 "index": 103,
@@ -222,40 +200,27 @@ class TestParametersResponse:
             }
         }
 
-        response = ParametersResponse(timestamp=timestamp, parameters=params)
+        response = ParametersResponse(timestamp=_T0, parameters=params)
 
-        assert response.timestamp == timestamp
+        assert response.timestamp == _T0
         assert len(response.parameters) == 1
         assert "HDWTSetPoint" in response.parameters
 
     def test_parameters_response_empty(self):
         """Test parameters response with no parameters."""
-        response = ParametersResponse(timestamp=datetime.now(), parameters={})
+        response = ParametersResponse(timestamp=_T0, parameters={})
         assert len(response.parameters) == 0
 
 
 class TestParameterSetRequest:
     """Tests for ParameterSetRequest model."""
 
-    def test_set_request_integer(self):
-        """Test parameter set request with integer value."""
-        request = ParameterSetRequest(value=50)
-        assert request.value == 50
-
-    def test_set_request_float(self):
-        """Test parameter set request with float value."""
-        request = ParameterSetRequest(value=22.5)
-        assert request.value == 22.5
-
-    def test_set_request_bool(self):
-        """Test parameter set request with boolean value."""
-        request = ParameterSetRequest(value=True)
-        assert request.value is True
-
-    def test_set_request_string(self):
-        """Test parameter set request with string value."""
-        request = ParameterSetRequest(value="test")
-        assert request.value == "test"
+    @pytest.mark.parametrize("value", [50, 22.5, True, "test"], ids=["int", "float", "bool", "string"])
+    def test_set_request_value_types(self, value):
+        """Test parameter set request keeps integer, float, bool and string values."""
+        request = ParameterSetRequest(value=value)
+        assert request.value == value
+        assert type(request.value) is type(value)
 
 
 class TestParameterSetResponse:
@@ -309,13 +274,13 @@ class TestHealthResponse:
             status="healthy",
             controller_connected=True,
             parameters_count=1786,
-            last_update=datetime(2026, 1, 13, 10, 30, 0),
+            last_update=_T0,
         )
 
         assert response.status == "healthy"
         assert response.controller_connected is True
         assert response.parameters_count == 1786
-        assert response.last_update is not None
+        assert response.last_update == _T0
 
     def test_health_response_unhealthy(self):
         """Test unhealthy status response."""
@@ -1,6 +1,7 @@
 """Unit tests for serial communication layer (GM3Protocol + GM3SerialTransport)."""
 
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -10,35 +11,83 @@ from econext_gateway.protocol.frames import Frame
 from econext_gateway.serial.connection import GM3SerialTransport
 from econext_gateway.serial.protocol import GM3Protocol
 
+
+def _frame_bytes(destination: int, command: int, data: bytes) -> bytes:
+    return Frame(destination=destination, command=command, data=data).to_bytes()
+
+
+def _corrupt_crc(raw: bytes) -> bytes:
+    corrupted = bytearray(raw)
+    corrupted[-3] ^= 0xFF
+    return bytes(corrupted)
+
+
+# Every wire frame fed to data_received, serialized once at import
+FRAMES = SimpleNamespace(
+    empty=_frame_bytes(1, Command.GET_PARAMS, b""),
+    d01=_frame_bytes(1, Command.GET_PARAMS, b"\x01"),
+    d02=_frame_bytes(1, Command.GET_PARAMS, b"\x02"),
+    d0102=_frame_bytes(1, Command.GET_PARAMS, b"\x01\x02"),
+    d00000100=_frame_bytes(1, Command.GET_PARAMS, b"\x00\x00\x01\x00"),
+    resp=_frame_bytes(2, Command.GET_PARAMS_RESPONSE, b"\x01"),
+)
+FRAMES.bad_crc = _corrupt_crc(FRAMES.empty)
+
 # ============================================================================
 # TestGM3Protocol
 # ============================================================================
 
 
+class _FakeSerial:
+    """Stand-in for the pyserial port; records flush calls in order."""
+
+    def __init__(self, calls: list[str]) -> None:
+        self._calls = calls
+
+    def flush(self) -> None:
+        self._calls.append("flush")
+
+    def reset_input_buffer(self) -> None:
+        self._calls.append("reset_input_buffer")
+
+
+class _FakeTransport:
+    """Stand-in for SerialTransport; records writes and port calls in one log."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.written: list[bytes] = []
+        self.serial = _FakeSerial(self.calls)
+
+    def write(self, data: bytes) -> None:
+        self.written.append(data)
+        self.calls.append("write")
+
+
+@pytest.fixture
+def proto_and_transport() -> tuple[GM3Protocol, _FakeTransport]:
+    """Protocol connected to a fresh fake transport."""
+    protocol = GM3Protocol()
+    transport = _FakeTransport()
+    protocol.connection_made(transport)
+    return protocol, transport
+
+
 class TestGM3Protocol:
     """Tests for GM3Protocol -- asyncio.Protocol for GM3 framing."""
 
-    def _make_protocol(self) -> tuple[GM3Protocol, MagicMock]:
-        """Create a protocol with a mock transport."""
-        protocol = GM3Protocol()
-        transport = MagicMock()
-        transport.serial = MagicMock()
-        protocol.connection_made(transport)
-        return protocol, transport
-
     def test_connection_made(self):
         """connection_made stores transport and sets connected."""
         protocol = GM3Protocol()
         assert protocol.connected is False
 
-        transport = MagicMock()
-        protocol.connection_made(transport)
+        protocol.connection_made(_FakeTransport())
 
         assert protocol.connected is True
 
-    def test_connection_lost(self):
+    def test_connection_lost(self, proto_and_transport):
         """connection_lost clears transport and pushes sentinel."""
-        protocol, transport = self._make_protocol()
+        protocol, transport = proto_and_transport
         assert protocol.connected is True
 
         protocol.connection_lost(None)
@@ -46,115 +95,87 @@ class TestGM3Protocol:
         assert protocol.connected is False
 
     @pytest.mark.asyncio
-    async def test_connection_lost_pushes_sentinel(self):
+    async def test_connection_lost_pushes_sentinel(self, proto_and_transport):
         """connection_lost pushes None onto the frame queue."""
-        protocol, _ = self._make_protocol()
+        protocol, _ = proto_and_transport
         protocol.connection_lost(None)
 
-        frame = await asyncio.wait_for(protocol._frame_queue.get(), timeout=0.1)
+        frame = await asyncio.wait_for(protocol._frame_queue.get(), timeout=0.01)
         assert frame is None
 
-    @pytest.mark.asyncio
-    async def test_complete_frame_arrives_on_queue(self):
-        """Feed a complete frame via data_received -> appears on queue."""
-        protocol, _ = self._make_protocol()
-
-        frame = Frame(destination=1, command=Command.GET_PARAMS, data=b"\x00\x00\x01\x00")
-        protocol.data_received(frame.to_bytes())
-
-        result = await asyncio.wait_for(protocol._frame_queue.get(), timeout=0.1)
-        assert result is not None
-        assert result.destination == 1
-        assert result.command == Command.GET_PARAMS
-        assert protocol.stats["frames_read"] == 1
-
-    @pytest.mark.asyncio
-    async def test_partial_then_complete(self):
-        """Feed partial data, then the rest -- frame appears after second call."""
-        protocol, _ = self._make_protocol()
-
-        frame_bytes = Frame(destination=1, command=Command.GET_PARAMS, data=b"\x01\x02").to_bytes()
-        mid = len(frame_bytes) // 2
-
-        protocol.data_received(frame_bytes[:mid])
-        assert protocol._frame_queue.empty()
-
-        protocol.data_received(frame_bytes[mid:])
-        result = await asyncio.wait_for(protocol._frame_queue.get(), timeout=0.1)
-        assert result is not None
-        assert result.command == Command.GET_PARAMS
-
-    @pytest.mark.asyncio
-    async def test_garbage_before_frame(self):
-        """Garbage bytes before a valid frame are discarded."""
-        protocol, _ = self._make_protocol()
-
-        frame_bytes = Frame(destination=1, command=Command.GET_PARAMS, data=b"").to_bytes()
-        protocol.data_received(b"\xff\xfe\xfd" + frame_bytes)
-
-        result = await asyncio.wait_for(protocol._frame_queue.get(), timeout=0.1)
-        assert result is not None
-        assert result.command == Command.GET_PARAMS
-
-    @pytest.mark.asyncio
-    async def test_invalid_crc_rejected(self):
-        """Frame with corrupted CRC is rejected and counted."""
-        protocol, _ = self._make_protocol()
-
-        frame_bytes = bytearray(Frame(destination=1, command=Command.GET_PARAMS, data=b"").to_bytes())
-        frame_bytes[-3] ^= 0xFF  # corrupt CRC
-        protocol.data_received(bytes(frame_bytes))
-
-        assert protocol._frame_queue.empty()
-        assert protocol.stats["frames_invalid"] >= 1
+    @pytest.mark.parametrize(
+        "chunks,expected_cmd",
+        [
+            # Complete frame in one read
+            ([FRAMES.d00000100], Command.GET_PARAMS),
+            # Partial data first -- frame appears only after the second read
+            ([FRAMES.d0102[: len(FRAMES.d0102) // 2], FRAMES.d0102[len(FRAMES.d0102) // 2 :]], Command.GET_PARAMS),
+            # Garbage bytes before a valid frame are discarded
+            ([b"\xff\xfe\xfd" + FRAMES.empty], Command.GET_PARAMS),
+            # Corrupted CRC is rejected and counted
+            ([FRAMES.bad_crc], None),
+        ],
+        ids=["complete", "partial_then_complete", "garbage_before_frame", "invalid_crc_rejected"],
+    )
+    def test_frame_extraction(self, proto_and_transport, chunks, expected_cmd):
+        """Feed reads via data_received; a valid frame lands on the queue, a bad one doesn't."""
+        protocol, _ = proto_and_transport
+
+        for chunk in chunks[:-1]:
+            protocol.data_received(chunk)
+            assert protocol._frame_queue.empty()
+        protocol.data_received(chunks[-1])
+
+        if expected_cmd is None:
+            assert protocol._frame_queue.empty()
+            assert protocol.stats["frames_invalid"] >= 1
+        else:
+            result = protocol._frame_queue.get_nowait()
+            assert result.destination == 1
+            assert result.command == expected_cmd
+            assert protocol.stats["frames_read"] == 1
 
     @pytest.mark.asyncio
-    async def test_receive_frame_timeout(self):
+    async def test_receive_frame_timeout(self, proto_and_transport):
         """receive_frame returns None on timeout."""
-        protocol, _ = self._make_protocol()
+        protocol, _ = proto_and_transport
 
-        result = await protocol.receive_frame(timeout=0.05)
+        result = await protocol.receive_frame(timeout=0.005)
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_receive_frame_returns_frame(self):
+    async def test_receive_frame_returns_frame(self, proto_and_transport):
         """receive_frame returns a parsed frame from the queue."""
-        protocol, _ = self._make_protocol()
+        protocol, _ = proto_and_transport
 
-        frame = Frame(destination=1, command=Command.GET_PARAMS, data=b"\x01")
-        protocol.data_received(frame.to_bytes())
+        protocol.data_received(FRAMES.d01)
 
         result = await protocol.receive_frame(timeout=0.1)
         assert result is not None
         assert result.command == Command.GET_PARAMS
 
     @pytest.mark.asyncio
-    async def test_write_frame_calls_transport_write(self):
+    async def test_write_frame_calls_transport_write(self, proto_and_transport):
         """write_frame calls transport.write with correct bytes."""
-        protocol, transport = self._make_protocol()
+        protocol, transport = proto_and_transport
 
         frame = Frame(destination=1, command=Command.GET_PARAMS, data=b"")
         result = await protocol.write_frame(frame)
 
         assert result is True
-        transport.write.assert_called_once_with(frame.to_bytes())
+        assert transport.written == [frame.to_bytes()]
         assert protocol.stats["frames_written"] == 1
 
     @pytest.mark.asyncio
-    async def test_write_frame_flush_after(self):
+    async def test_write_frame_flush_after(self, proto_and_transport):
         """write_frame with flush_after=True flushes TX then clears RX."""
-        protocol, transport = self._make_protocol()
+        protocol, transport = proto_and_transport
 
         frame = Frame(destination=1, command=Command.GET_PARAMS, data=b"")
         await protocol.write_frame(frame, flush_after=True)
 
-        transport.serial.flush.assert_called_once()
-        transport.serial.reset_input_buffer.assert_called_once()
         # flush() must come before reset_input_buffer() for half-duplex RS-485
-        calls = transport.serial.method_calls
-        flush_idx = next(i for i, c in enumerate(calls) if c[0] == "flush")
-        reset_idx = next(i for i, c in enumerate(calls) if c[0] == "reset_input_buffer")
-        assert flush_idx < reset_idx, "flush() must be called before reset_input_buffer()"
+        assert transport.calls == ["write", "flush", "reset_input_buffer"]
 
     @pytest.mark.asyncio
     async def test_write_frame_no_transport(self):
@@ -166,13 +187,23 @@ class TestGM3Protocol:
 
         assert result is False
 
-    def test_reset_buffer(self):
+    def test_try_receive_frame_nowait(self, proto_and_transport):
+        """try_receive_frame_nowait returns queued frames in order, then None."""
+        protocol, _ = proto_and_transport
+        assert protocol.try_receive_frame_nowait() is None
+
+        protocol.data_received(FRAMES.d01 + FRAMES.d02)
+
+        assert protocol.try_receive_frame_nowait().data == b"\x01"
+        assert protocol.try_receive_frame_nowait().data == b"\x02"
+        assert protocol.try_receive_frame_nowait() is None
+
+    def test_reset_buffer(self, proto_and_transport):
         """reset_buffer clears rx buffer and drains queue."""
-        protocol, _ = self._make_protocol()
+        protocol, _ = proto_and_transport
 
         # Add data to buffer and queue
-        frame = Frame(destination=1, command=Command.GET_PARAMS, data=b"")
-        protocol.data_received(frame.to_bytes())
+        protocol.data_received(FRAMES.empty)
         protocol._rx_buffer.extend(b"leftover data")
 
         assert not protocol._frame_queue.empty()
@@ -182,22 +213,18 @@ class TestGM3Protocol:
         assert len(protocol._rx_buffer) == 0
         assert protocol._frame_queue.empty()
 
-    @pytest.mark.asyncio
-    async def test_queue_full_drops_oldest(self):
+    def test_queue_full_drops_oldest(self, proto_and_transport):
         """When queue is full, oldest frame is dropped to make room."""
-        protocol, _ = self._make_protocol()
+        protocol, _ = proto_and_transport
 
-        # Fill queue to capacity
-        frame = Frame(destination=1, command=Command.GET_PARAMS, data=b"")
-        frame_bytes = frame.to_bytes()
-        for _ in range(64):
-            protocol.data_received(frame_bytes)
+        # Fill queue to capacity from one read: data_received drains every
+        # complete frame in the buffer before returning
+        protocol.data_received(FRAMES.empty * 64)
 
         assert protocol._frame_queue.full()
 
         # One more should succeed (dropping oldest)
-        new_frame = Frame(destination=2, command=Command.GET_PARAMS_RESPONSE, data=b"\x01")
-        protocol.data_received(new_frame.to_bytes())
+        protocol.data_received(FRAMES.resp)
 
         # Queue is still full, and the newest frame is there
         assert protocol._frame_queue.full()
@@ -209,6 +236,21 @@ class TestGM3Protocol:
 # ============================================================================
 
 
+@pytest.fixture
+def serial_connection():
+    """Patch serial_asyncio.create_serial_connection to hand back connected mocks.
+
+    Yields (mock_create, mock_transport, mock_protocol).
+    """
+    mock_transport = MagicMock()
+    mock_protocol = MagicMock(spec=GM3Protocol)
+    mock_protocol.connected = True
+
+    with patch("serial_asyncio.create_serial_connection", new_callable=AsyncMock) as mock_create:
+        mock_create.return_value = (mock_transport, mock_protocol)
+        yield mock_create, mock_transport, mock_protocol
+
+
 class TestGM3SerialTransport:
     """Tests for GM3SerialTransport."""
 
@@ -222,64 +264,69 @@ class TestGM3SerialTransport:
         assert not transport.connected
 
     @pytest.mark.asyncio
-    async def test_connect_success(self):
+    async def test_connect_success(self, serial_connection):
         """Test successful connection via serial_asyncio."""
-        mock_transport = MagicMock()
-        mock_protocol = MagicMock(spec=GM3Protocol)
-        mock_protocol.connected = True
-
-        with patch("serial_asyncio.create_serial_connection", new_callable=AsyncMock) as mock_create:
-            mock_create.return_value = (mock_transport, mock_protocol)
+        mock_create, _, _ = serial_connection
 
-            transport = GM3SerialTransport("/dev/ttyUSB0")
-            result = await transport.connect()
+        transport = GM3SerialTransport("/dev/ttyUSB0")
+        result = await transport.connect()
 
-            assert result is True
-            assert transport.connected is True
-            mock_create.assert_called_once()
+        assert result is True
+        assert transport.connected is True
+        mock_create.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_connect_failure(self):
+    async def test_connect_failure(self, serial_connection):
         """Test connection failure."""
-        with patch("serial_asyncio.create_serial_connection", new_callable=AsyncMock) as mock_create:
-            mock_create.side_effect = OSError("Port not found")
+        mock_create, _, _ = serial_connection
+        mock_create.side_effect = OSError("Port not found")
 
-            transport = GM3SerialTransport("/dev/ttyUSB0")
-            result = await transport.connect()
+        transport = GM3SerialTransport("/dev/ttyUSB0")
+        result = await transport.connect()
 
-            assert result is False
-            assert transport.connected is False
+        assert result is False
+        assert transport.connected is False
 
     @pytest.mark.asyncio
-    async def test_disconnect(self):
+    async def test_disconnect(self, serial_connection):
         """Test disconnection closes the transport."""
-        mock_transport = MagicMock()
-        mock_protocol = MagicMock(spec=GM3Protocol)
-        mock_protocol.connected = True
+        _, mock_transport, _ = serial_connection
 
-        with patch("serial_asyncio.create_serial_connection", new_callable=AsyncMock) as mock_create:
-            mock_create.return_value = (mock_transport, mock_protocol)
+        transport = GM3SerialTransport("/dev/ttyUSB0")
+        await transport.connect()
+        assert transport.connected is True
 
-            transport = GM3SerialTransport("/dev/ttyUSB0")
-            await transport.connect()
-            assert transport.connected is True
+        await transport.disconnect()
+
+        mock_transport.close.assert_called_once()
+        assert transport.connected is False
+
+    @pytest.mark.asyncio
+    async def test_wait_connected_blocks_until_connect(self, serial_connection):
+        """wait_connected parks without polling and wakes on a successful connect."""
+        _, _, mock_protocol = serial_connection
+
+        transport = GM3SerialTransport("/dev/ttyUSB0")
+        waiter = asyncio.create_task(transport.wait_connected())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
 
-            await transport.disconnect()
+        await transport.connect()
+        await asyncio.wait_for(waiter, timeout=1.0)
 
-            mock_transport.close.assert_called_once()
-            assert transport.connected is False
+        # Port lost underneath us: the next wait blocks again
+        mock_protocol.connected = False
+        waiter = asyncio.create_task(transport.wait_connected())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        waiter.cancel()
 
     @pytest.mark.asyncio
-    async def test_context_manager(self):
+    async def test_context_manager(self, serial_connection):
         """Test async context manager."""
-        mock_transport = MagicMock()
-        mock_protocol = MagicMock(spec=GM3Protocol)
-        mock_protocol.connected = True
+        _, mock_transport, _ = serial_connection
 
-        with patch("serial_asyncio.create_serial_connection", new_callable=AsyncMock) as mock_create:
-            mock_create.return_value = (mock_transport, mock_protocol)
-
-            async with GM3SerialTransport("/dev/ttyUSB0") as transport:
-                assert transport.connected is True
+        async with GM3SerialTransport("/dev/ttyUSB0") as transport:
+            assert transport.connected is True
 
-            mock_transport.close.assert_called_once()
+        mock_transport.close.assert_called_once()